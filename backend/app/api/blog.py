@@ -1,15 +1,11 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 
-from ..services.medium_scraper import MediumScraper
+from ..services.content_store import blog_index
 
 router = APIRouter()
 
 
-def load_blog_posts():
-    """Load blog posts from Medium."""
-    return MediumScraper.get_medium_posts()
-
 @router.get("/")
 async def get_blog_posts_api(
     limit: int = Query(10, description="Number of posts to return"),
@@ -18,18 +14,11 @@ async def get_blog_posts_api(
     featured: Optional[bool] = Query(None, description="Filter featured posts only")
 ):
     """Get blog posts with optional filtering."""
-    all_posts = [post for post in load_blog_posts() if post.published]
-    filtered_posts = all_posts
-
-    if tag:
-        filtered_posts = [post for post in filtered_posts if tag in post.tags]
-
-    if featured is not None:
-        filtered_posts = [post for post in filtered_posts if post.featured == featured]
+    filtered_posts = (await blog_index.get()).select(tag=tag, featured=featured)
 
     # Apply pagination
     total = len(filtered_posts)
-    posts = filtered_posts[offset:offset + limit]
+    posts = list(filtered_posts[offset:offset + limit])
 
     return {
         "posts": posts,
@@ -40,27 +29,23 @@ async def get_blog_posts_api(
 
 @router.get("/{post_id}")
 async def get_blog_post(post_id: str):
-    """Get a specific blog post by ID."""
-    posts = load_blog_posts()
-    post = next((p for p in posts if p.id == post_id and p.published), None)
+    """Get a specific blog post by ID, including its rendered body."""
+    index = await blog_index.get()
+    post = index.by_id.get(post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
-    return post
+    return index.full_post(post)
 
 @router.get("/slug/{slug}")
 async def get_blog_post_by_slug(slug: str):
-    """Get a specific blog post by slug."""
-    posts = load_blog_posts()
-    post = next((p for p in posts if p.slug == slug and p.published), None)
+    """Get a specific blog post by slug, including its rendered body."""
+    index = await blog_index.get()
+    post = index.by_slug.get(slug)
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
-    return post
+    return index.full_post(post)
 
 @router.get("/tags/all")
 async def get_all_tags():
     """Get all unique tags from blog posts."""
-    posts = [post for post in load_blog_posts() if post.published]
-    tags = set()
-    for post in posts:
-        tags.update(post.tags)
-    return {"tags": sorted(list(tags))}
+    return {"tags": list((await blog_index.get()).tags)}
@@ -1,60 +1,177 @@
-from fastapi import APIRouter, Header, HTTPException
-
-from ..content.markdown_reader import MarkdownReader
+from datetime import date
+from typing import AsyncIterator, Iterable, Literal
+import json
+import logging
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ..content.bio_snapshot import (
+    FieldMode,
+    excluded_fields,
+    parse_sections,
+    section_view,
+    sections_for_paths,
+)
+from ..content.date_index import SortOrder, decode_cursor
 from ..core.config import get_settings
-from ..services.content_store import content_repository
+from ..services.content_store import (
+    bio_snapshots,
+    blog_index,
+    content_refresher,
+    content_repository,
+    section_snapshots,
+)
+from ..services.github_webhook import parse_push, verify_signature
+from ..services.http_cache import REVALIDATE_CACHE_CONTROL, SerializedPayload, payload_response
 
 router = APIRouter()
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FIELDS_QUERY = Query(
+    "all",
+    description="Markdown-backed fields to return: raw markdown, rendered html, or all",
+)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Items encoded per streamed chunk.
+NDJSON_BATCH_SIZE = 100
+
+
+class ListingParams:
+    """Paging, date-range and sort options of the dated section endpoints."""
+
+    def __init__(
+        self,
+        cursor: str | None = Query(None, description="next_cursor of the previous page"),
+        limit: int | None = Query(
+            None,
+            ge=1,
+            description=f"Items per page (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE}); caps the stream with format=ndjson",
+        ),
+        since: date | None = Query(None, description="Only items dated on or after this day"),
+        until: date | None = Query(None, description="Only items dated on or before this day"),
+        sort: SortOrder | None = Query(None, description="Date order: desc (newest first, default) or asc"),
+        format: Literal["json", "ndjson"] | None = Query(
+            None, description="ndjson streams one item per line instead of a page"
+        ),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.since = since
+        self.until = until
+        self.sort: SortOrder = sort or "desc"
+        self.format = format or "json"
+        # Without any option the endpoint keeps serving the whole section as before.
+        self.requested = any(
+            value is not None for value in (cursor, limit, since, until, sort, format)
+        )
+
+
+async def section_response(request: Request, section: str, fields: FieldMode = "all"):
+    """Serve a pre-serialized section, loading only that section's markdown file."""
+    snapshot = await section_snapshots.get(section)
+    return await payload_response(request, snapshot.payload(fields))
+
+async def _ndjson_lines(items: Iterable, exclude: set[str] | None) -> AsyncIterator[bytes]:
+    batch = []
+    for item in items:
+        batch.append(item.model_dump_json(exclude=exclude).encode("utf-8") + b"\n")
+        if len(batch) == NDJSON_BATCH_SIZE:
+            yield b"".join(batch)
+            batch = []
+    if batch:
+        yield b"".join(batch)
+
+
+async def dated_section_response(
+    request: Request, section: str, fields: FieldMode, params: ListingParams
+):
+    """Serve a dated section whole, as a cursor-paged slice, or as an NDJSON stream."""
+    if not params.requested:
+        return await section_response(request, section, fields)
+    try:
+        cursor = decode_cursor(params.cursor) if params.cursor else None
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+    index = (await section_snapshots.get(section)).date_index()
+    if params.format == "ndjson":
+        items = index.scan(cursor, params.since, params.until, params.sort, params.limit)
+        return StreamingResponse(
+            _ndjson_lines(items, excluded_fields(section, fields)),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={
+                "Cache-Control": REVALIDATE_CACHE_CONTROL,
+                "X-Total-Count": str(index.count(params.since, params.until)),
+            },
+        )
+
+    limit = params.limit or DEFAULT_PAGE_SIZE
+    if limit > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=422, detail=f"limit must be at most {MAX_PAGE_SIZE}")
+    page = index.page(limit, cursor, params.since, params.until, params.sort)
+    body = section_view(section, page.items, fields)
+    body.update(total=page.total, limit=limit, next_cursor=page.next_cursor)
+    return await payload_response(request, SerializedPayload.from_object(body))
 
 
-def get_bio_data():
-    """Load the bio data using the shared content repository."""
-    return MarkdownReader.load_bio_data(content_repository)
-
 @router.get("/")
-async def get_content():
+async def get_content(
+    request: Request,
+    include: str | None = Query(
+        None,
+        description="Comma-separated sections to return (bio, experience, education, talks, publications)",
+    ),
+    fields: FieldMode = FIELDS_QUERY,
+):
     """Get all portfolio content."""
-    return get_bio_data()
+    try:
+        sections = parse_sections(include)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    snapshot = await bio_snapshots.get()
+    return await payload_response(request, snapshot.payload(sections, fields))
 
 @router.get("/bio")
-async def get_bio():
+async def get_bio(request: Request):
     """Get bio information."""
-    bio_data = get_bio_data()
-    return {
-        "name": bio_data.name,
-        "title": bio_data.title,
-        "summary": bio_data.summary,
-        "about": bio_data.about
-    }
+    return await section_response(request, "bio")
 
 
 
 @router.get("/experience")
-async def get_experience():
+async def get_experience(request: Request, fields: FieldMode = FIELDS_QUERY):
     """Get work experience."""
-    bio_data = get_bio_data()
-    return {"experience": bio_data.experience}
+    return await section_response(request, "experience", fields)
 
 @router.get("/education")
-async def get_education():
+async def get_education(request: Request):
     """Get education history."""
-    bio_data = get_bio_data()
-    return {"education": bio_data.education}
+    return await section_response(request, "education")
 
 
 @router.get("/talks")
-async def get_talks():
-    """Get public talks."""
-    bio_data = get_bio_data()
-    return {"talks": bio_data.talks}
+async def get_talks(
+    request: Request,
+    fields: FieldMode = FIELDS_QUERY,
+    params: ListingParams = Depends(),
+):
+    """Get public talks, optionally paged, filtered by date or streamed."""
+    return await dated_section_response(request, "talks", fields, params)
 
 
 @router.get("/publications")
-async def get_publications():
-    """Get publications."""
-    bio_data = get_bio_data()
-    return {"publications": bio_data.publications}
+async def get_publications(
+    request: Request,
+    fields: FieldMode = FIELDS_QUERY,
+    params: ListingParams = Depends(),
+):
+    """Get publications, optionally paged, filtered by date or streamed."""
+    return await dated_section_response(request, "publications", fields, params)
 
 
 @router.post("/reload", status_code=204)
@@ -65,3 +182,48 @@ async def reload_content(x_reload_token: str | None = Header(default=None)):
     if x_reload_token != settings.reload_token:
         raise HTTPException(status_code=403, detail="Invalid reload token")
     content_repository.clear_cache()
+    bio_snapshots.invalidate()
+    section_snapshots.invalidate()
+    blog_index.invalidate()
+
+
+@router.post("/webhook")
+async def github_webhook(
+    request: Request,
+    x_hub_signature_256: str | None = Header(default=None),
+    x_github_event: str | None = Header(default=None),
+):
+    """Refresh only the files changed by a GitHub push (requires CONTENT_WEBHOOK_SECRET)."""
+    if not settings.webhook_secret:
+        raise HTTPException(status_code=404, detail="Webhook endpoint not configured")
+    body = await request.body()
+    if not verify_signature(settings.webhook_secret, body, x_hub_signature_256):
+        raise HTTPException(status_code=403, detail="Invalid webhook signature")
+    if x_github_event == "ping":
+        return {"status": "pong"}
+    if x_github_event != "push":
+        return {"status": "ignored"}
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    changes = parse_push(payload, settings)
+    if changes is None:
+        return {"status": "ignored"}
+
+    try:
+        if changes.complete:
+            await content_repository.refresh_paths(changes.paths, ref=changes.head)
+            section_snapshots.invalidate(sections_for_paths(changes.paths))
+        else:
+            # The payload cannot name every changed file; revalidate with ETags instead.
+            await content_repository.revalidate()
+        await content_refresher.notify()
+    except Exception:
+        logger.exception("Webhook content refresh failed")
+        raise HTTPException(status_code=502, detail="Content refresh failed")
+    return {
+        "status": "refreshed",
+        "paths": sorted(changes.paths) if changes.complete else None,
+    }
@@ -0,0 +1,267 @@
+"""
+Versioned, memoized Bio snapshots.
+Each section is cached against its own markdown file; the Bio is composed from
+the section snapshots, so an edit to one file rebuilds only that section.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Literal
+import asyncio
+
+from ..models.portfolio import Bio
+from ..services import metrics
+from ..services.content_repository import ContentRepository
+from ..services.http_cache import SerializedPayload
+from ..services.single_flight import SingleFlight
+from .date_index import DateIndex
+from .markdown_reader import MarkdownReader
+
+ContentVersions = tuple[tuple[str, str | None], ...]
+
+# Bio sections in Bio field order, with the markdown file and loader behind each.
+# "bio" is the profile (name, title, summary, about); the others are lists.
+CONTENT_SECTIONS: Dict[str, tuple[str, Callable[[ContentRepository], Awaitable[Any]]]] = {
+    "bio": ("bio.md", MarkdownReader.load_profile),
+    "experience": ("experience.md", MarkdownReader.load_experience),
+    "education": ("education.md", MarkdownReader.load_education),
+    "talks": ("talks.md", MarkdownReader.load_talks),
+    "publications": ("publications.md", MarkdownReader.load_publications),
+}
+
+BIO_SOURCE_FILES: tuple[str, ...] = tuple(path for path, _ in CONTENT_SECTIONS.values())
+
+# Which section each source file feeds.
+SECTION_BY_PATH: Dict[str, str] = {
+    path: section for section, (path, _) in CONTENT_SECTIONS.items()
+}
+
+PROFILE_FIELDS = ("name", "title", "summary", "about")
+
+# Raw markdown fields and their rendered HTML twins.
+MARKDOWN_FIELDS: Dict[str, tuple[str, str]] = {
+    "experience": ("description", "description_html"),
+    "talks": ("description", "description_html"),
+    "publications": ("summary", "summary_html"),
+}
+
+# Sections whose items carry a date and id, and can be paged by date.
+DATED_SECTIONS = ("talks", "publications")
+
+FieldMode = Literal["all", "html", "markdown"]
+
+
+def section_value(bio: Bio, section: str) -> Any:
+    """Extract one section's data from a Bio."""
+    if section == "bio":
+        return {name: getattr(bio, name) for name in PROFILE_FIELDS}
+    return getattr(bio, section)
+
+
+def excluded_fields(section: str, fields: FieldMode) -> set[str] | None:
+    """Return the item fields a projection drops, or None to keep them all."""
+    if fields == "all" or section not in MARKDOWN_FIELDS:
+        return None
+    markdown_field, html_field = MARKDOWN_FIELDS[section]
+    return {markdown_field if fields == "html" else html_field}
+
+
+def section_view(section: str, value: Any, fields: FieldMode = "all") -> Dict[str, Any]:
+    """Return the response body of a section, optionally dropping markdown or HTML."""
+    if section == "bio":
+        return value
+    dropped = excluded_fields(section, fields)
+    if dropped:
+        value = [item.model_dump(exclude=dropped) for item in value]
+    return {section: value}
+
+
+def sections_for_paths(paths: Iterable[str]) -> set[str]:
+    """Return the sections that depend on any of the given content paths."""
+    return {SECTION_BY_PATH[path] for path in paths if path in SECTION_BY_PATH}
+
+
+def parse_sections(include: str | None) -> tuple[str, ...]:
+    """Parse a comma-separated include list into sections in canonical order."""
+    if not include:
+        return tuple(CONTENT_SECTIONS)
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = requested.difference(CONTENT_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}")
+    return tuple(section for section in CONTENT_SECTIONS if section in requested)
+
+
+@dataclass(frozen=True)
+class BioSnapshot:
+    """An immutable Bio paired with the source versions it was built from."""
+
+    versions: ContentVersions
+    bio: Bio
+    _payloads: Dict[tuple, SerializedPayload] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def payload(
+        self, sections: tuple[str, ...] | None = None, fields: FieldMode = "all"
+    ) -> SerializedPayload:
+        """Return the JSON body for a projection of the Bio, encoding it once per snapshot."""
+        sections = sections or tuple(CONTENT_SECTIONS)
+        key = (sections, fields)
+        payload = self._payloads.get(key)
+        if payload is None:
+            if sections == tuple(CONTENT_SECTIONS) and fields == "all":
+                value: Any = self.bio
+            else:
+                value = {}
+                for section in sections:
+                    value.update(section_view(section, section_value(self.bio, section), fields))
+            payload = SerializedPayload.from_object(value)
+            self._payloads[key] = payload
+        return payload
+
+
+@dataclass(frozen=True)
+class SectionSnapshot:
+    """One section's data paired with the version of its source file."""
+
+    section: str
+    version: str | None
+    value: Any
+    _payloads: Dict[str, SerializedPayload] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    _indexes: Dict[str, DateIndex] = field(default_factory=dict, compare=False, repr=False)
+
+    def payload(self, fields: FieldMode = "all") -> SerializedPayload:
+        """Return the section's JSON body, encoding each projection once per snapshot."""
+        payload = self._payloads.get(fields)
+        if payload is None:
+            payload = SerializedPayload.from_object(section_view(self.section, self.value, fields))
+            self._payloads[fields] = payload
+        return payload
+
+    def date_index(self) -> DateIndex:
+        """Return the items of a dated section sorted by (date, id), sorting once per snapshot."""
+        if self.section not in DATED_SECTIONS:
+            raise ValueError(f"Section {self.section!r} has no dated items")
+        index = self._indexes.get("date")
+        if index is None:
+            index = DateIndex.build(self.value)
+            self._indexes["date"] = index
+        return index
+
+
+class SectionSnapshotCache:
+    """Loads each section from its own markdown file, only when that file changes."""
+
+    def __init__(self, repository: ContentRepository):
+        self.repository = repository
+        self._snapshots: Dict[str, SectionSnapshot] = {}
+        # Concurrent requests for the same section version share one rebuild.
+        self._flights = SingleFlight()
+
+    async def get(self, section: str) -> SectionSnapshot:
+        path, _ = CONTENT_SECTIONS[section]
+        version = await self.repository.file_version(path)
+        snapshot = self._snapshots.get(section)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        return await self._flights.run((section, version), lambda: self._build(section, version))
+
+    async def _build(self, section: str, version: str | None) -> SectionSnapshot:
+        _, load = CONTENT_SECTIONS[section]
+        with metrics.section_load_seconds.time(section):
+            value = await load(self.repository)
+        snapshot = SectionSnapshot(section=section, version=version, value=value)
+        self._snapshots[section] = snapshot
+        return snapshot
+
+    def seed(
+        self,
+        section: str,
+        version: str | None,
+        value: Any,
+        payloads: Dict[str, SerializedPayload] | None = None,
+    ) -> None:
+        """Install already-built section data (e.g. restored from a persistent cache)."""
+        self._snapshots[section] = SectionSnapshot(
+            section=section, version=version, value=value, _payloads=dict(payloads or {})
+        )
+
+    def invalidate(self, sections: Iterable[str] | None = None) -> None:
+        """Drop the given sections (all by default) so the next request reloads them."""
+        if sections is None:
+            self._snapshots.clear()
+            return
+        for section in sections:
+            self._snapshots.pop(section, None)
+
+
+class BioSnapshotCache:
+    """Hands out the same BioSnapshot until a section changes."""
+
+    def __init__(self, sections: SectionSnapshotCache):
+        self.sections = sections
+        self._snapshot: BioSnapshot | None = None
+
+    async def get(self) -> BioSnapshot:
+        """Return the cached snapshot, recomposing it if any section changed."""
+        parts = await asyncio.gather(*(self.sections.get(section) for section in CONTENT_SECTIONS))
+        versions = tuple((CONTENT_SECTIONS[part.section][0], part.version) for part in parts)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.versions == versions:
+            return snapshot
+
+        # Composing is synchronous, so concurrent callers cannot interleave here.
+        values = {part.section: part.value for part in parts}
+        with metrics.stage_seconds.time("compose"):
+            bio = Bio(**values.pop("bio"), **values)
+        snapshot = BioSnapshot(versions=versions, bio=bio)
+        self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the composed snapshot so the next request recomposes it."""
+        self._snapshot = None
+
+    def export_state(self) -> Dict[str, Any] | None:
+        """Return the current snapshot as JSON-compatible data."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        payload = snapshot.payload()
+        return {
+            "versions": [list(item) for item in snapshot.versions],
+            "content": {"body": str(payload.body, "utf-8"), "etag": payload.etag},
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Install a snapshot from exported data without re-rendering anything."""
+        content = SerializedPayload(
+            body=state["content"]["body"].encode("utf-8"), etag=state["content"]["etag"]
+        )
+        self.install(state["versions"], content)
+
+    def install(
+        self,
+        versions: Iterable[Iterable[str | None]],
+        content: SerializedPayload,
+        section_payloads: Dict[tuple[str, FieldMode], SerializedPayload] | None = None,
+    ) -> None:
+        """Install a serialized snapshot and its sections, reusing the given payloads."""
+        snapshot = BioSnapshot(
+            versions=tuple((path, version) for path, version in versions),
+            bio=Bio.model_validate_json(bytes(content.body)),
+            _payloads={(tuple(CONTENT_SECTIONS), "all"): content},
+        )
+        section_payloads = section_payloads or {}
+        by_path = dict(snapshot.versions)
+        for section, (path, _) in CONTENT_SECTIONS.items():
+            payloads = {
+                fields: payload
+                for (name, fields), payload in section_payloads.items()
+                if name == section
+            }
+            self.sections.seed(
+                section, by_path.get(path), section_value(snapshot.bio, section), payloads
+            )
+        self._snapshot = snapshot
@@ -0,0 +1,98 @@
+"""
+Markdown-backed blog post reader.
+Posts live in blog/*.md with YAML frontmatter; bodies are rendered on demand.
+"""
+from datetime import datetime, time as time_type, timezone
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Tuple
+import asyncio
+import logging
+
+from ..models.blog import BlogPost
+from ..services.blog_index import BlogEntry
+from ..services.content_repository import ContentRepository
+from ..services.medium_scraper import MediumScraper
+from .markdown_reader import MarkdownReader
+
+BLOG_DIRECTORY = "blog"
+
+logger = logging.getLogger(__name__)
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    """Normalize frontmatter dates to timezone-aware datetimes (naive means UTC)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, time_type.min)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class BlogReader:
+    """Reads blog posts through the content repository."""
+
+    @staticmethod
+    async def post_paths(repository: ContentRepository) -> List[str]:
+        """Return repository paths of every markdown post, sorted."""
+        names = await repository.list_markdown_files(BLOG_DIRECTORY)
+        return sorted(f"{BLOG_DIRECTORY}/{name}" for name in names if name.endswith(".md"))
+
+    @staticmethod
+    async def source_version(repository: ContentRepository) -> Tuple[Tuple[str, str | None], ...]:
+        """Return the content version of every post file."""
+        paths = await BlogReader.post_paths(repository)
+        versions = await asyncio.gather(*(repository.file_version(path) for path in paths))
+        return tuple(zip(paths, versions))
+
+    @staticmethod
+    def build_post(frontmatter: Dict[str, Any], path: str) -> BlogPost:
+        """Create a BlogPost from frontmatter (the body is not rendered here).
+
+        Raises ValueError or TypeError when required fields are missing or invalid.
+        """
+        published_at = _as_datetime(frontmatter.get('published_at'))
+        if published_at is None:
+            raise ValueError("missing published_at")
+        title = frontmatter.get('title', '')
+        medium_url = frontmatter.get('medium_url')
+        default_id = (
+            MediumScraper.extract_article_id(medium_url)
+            if medium_url
+            else PurePosixPath(path).stem
+        )
+        return BlogPost(
+            id=str(frontmatter.get('id') or default_id),
+            title=title,
+            slug=frontmatter.get('slug') or MediumScraper.slugify(title),
+            medium_url=medium_url,
+            excerpt=frontmatter.get('excerpt', ''),
+            author=frontmatter.get('author', ''),
+            published_at=published_at,
+            updated_at=_as_datetime(frontmatter.get('updated_at')),
+            tags=frontmatter.get('tags', []),
+            thumbnail_url=frontmatter.get('thumbnail_url'),
+            featured=frontmatter.get('featured', False),
+            published=frontmatter.get('published', True),
+        )
+
+    @staticmethod
+    async def load_entries(repository: ContentRepository) -> List[BlogEntry]:
+        """Load every post with its unrendered markdown body."""
+        paths = await BlogReader.post_paths(repository)
+        documents = await asyncio.gather(
+            *(MarkdownReader.read_markdown_from_repository(repository, path) for path in paths)
+        )
+        entries: List[BlogEntry] = []
+        for path, (frontmatter, body) in zip(paths, documents):
+            if not frontmatter:
+                continue
+            try:
+                entries.append((BlogReader.build_post(frontmatter, path), body))
+            except (TypeError, ValueError) as exc:
+                # One broken post must not take the whole blog down.
+                logger.warning("Skipping blog post %s: %s", path, exc)
+        return entries
@@ -0,0 +1,133 @@
+"""
+Date-sorted index over a dated section (talks, publications) for keyset paging.
+
+Items are ordered by (date, id). A cursor encodes the position of the last
+item a client received, so pages stay consistent while content changes.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date as date_type
+from typing import Any, Iterator, List, Literal, Sequence, Tuple
+import base64
+import binascii
+
+SortOrder = Literal["asc", "desc"]
+Position = Tuple[int, str]
+
+
+def encode_cursor(position: Position) -> str:
+    day, item_id = position
+    raw = f"{date_type.fromordinal(day).isoformat()}|{item_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Position:
+    """Parse a cursor from encode_cursor, raising ValueError when it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    day, separator, item_id = raw.partition("|")
+    if not separator:
+        raise ValueError("Invalid cursor")
+    return date_type.fromisoformat(day).toordinal(), item_id
+
+
+@dataclass(frozen=True)
+class Page:
+    """A slice of the index in the requested order."""
+
+    items: List[Any]
+    total: int
+    next_cursor: str | None
+
+
+@dataclass(frozen=True)
+class DateIndex:
+    """Items sorted ascending by (date, id), with their positions for bisecting."""
+
+    items: Tuple[Any, ...]
+    positions: Tuple[Position, ...]
+
+    @classmethod
+    def build(cls, items: Sequence[Any], date_attr: str = "date") -> "DateIndex":
+        keyed = sorted(
+            ((getattr(item, date_attr).toordinal(), str(item.id)), item) for item in items
+        )
+        return cls(
+            items=tuple(item for _, item in keyed),
+            positions=tuple(position for position, _ in keyed),
+        )
+
+    def _window(
+        self, since: date_type | None, until: date_type | None
+    ) -> Tuple[int, int]:
+        low = 0 if since is None else bisect_left(self.positions, (since.toordinal(),))
+        high = (
+            len(self.positions)
+            if until is None
+            else bisect_left(self.positions, (until.toordinal() + 1,))
+        )
+        return low, max(low, high)
+
+    def _range(
+        self,
+        cursor: Position | None,
+        since: date_type | None,
+        until: date_type | None,
+        sort: SortOrder,
+    ) -> Tuple[int, int, int]:
+        """Return (low, high, total): the unread window and the filtered size."""
+        low, high = self._window(since, until)
+        total = high - low
+        if cursor is not None:
+            if sort == "asc":
+                low = max(low, bisect_right(self.positions, cursor))
+            else:
+                high = min(high, bisect_left(self.positions, cursor))
+        return low, max(low, high), total
+
+    def count(self, since: date_type | None = None, until: date_type | None = None) -> int:
+        low, high = self._window(since, until)
+        return high - low
+
+    def page(
+        self,
+        limit: int,
+        cursor: Position | None = None,
+        since: date_type | None = None,
+        until: date_type | None = None,
+        sort: SortOrder = "desc",
+    ) -> Page:
+        low, high, total = self._range(cursor, since, until, sort)
+        if sort == "asc":
+            end = min(high, low + limit)
+            items = list(self.items[low:end])
+            more, last = end < high, end - 1
+        else:
+            start = max(low, high - limit)
+            items = list(reversed(self.items[start:high]))
+            more, last = start > low, start
+        next_cursor = encode_cursor(self.positions[last]) if more else None
+        return Page(items=items, total=total, next_cursor=next_cursor)
+
+    def scan(
+        self,
+        cursor: Position | None = None,
+        since: date_type | None = None,
+        until: date_type | None = None,
+        sort: SortOrder = "desc",
+        limit: int | None = None,
+    ) -> Iterator[Any]:
+        """Yield matching items in order without copying the range."""
+        low, high, _ = self._range(cursor, since, until, sort)
+        if limit is not None:
+            if sort == "asc":
+                high = min(high, low + limit)
+            else:
+                low = max(low, high - limit)
+        indexes = range(low, high) if sort == "asc" else range(high - 1, low - 1, -1)
+        for index in indexes:
+            yield self.items[index]
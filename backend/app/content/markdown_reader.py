@@ -2,11 +2,17 @@
 Markdown content reader for portfolio data.
 Parses YAML frontmatter and markdown content from files.
 """
+from collections import OrderedDict
 from datetime import date as date_type
-from typing import Any, Dict
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+import asyncio
+import hashlib
+import re
 
 import yaml
 
+from ..core.config import get_settings
 from ..models.portfolio import (
     Bio,
     Education,
@@ -14,70 +20,125 @@ from ..models.portfolio import (
     Talk,
     Publication,
 )
+from ..services import metrics
 from ..services.content_repository import ContentRepository
 from ..services.markdown_renderer import render_markdown
 
+# libyaml's C loader is much faster; fall back to the pure-Python one without it.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Frontmatter opens on the first line and closes at the next line that is exactly
+# "---", so "---" inside a YAML value or block scalar does not end it.
+_FRONTMATTER = re.compile(r"\A---[ \t]*\r?\n(.*?)^---[ \t]*\r?$", re.MULTILINE | re.DOTALL)
+
+Document = Tuple[Dict[str, Any], str]
+
+
+class FrontmatterCache:
+    """Content-addressed LRU of parsed documents, budgeted by source size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Tuple[Document, int]] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def key(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Document | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, document: Document, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (document, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+frontmatter_cache = FrontmatterCache(get_settings().frontmatter_cache_max_bytes)
+
 
 class MarkdownReader:
     """Reads and parses markdown files with YAML frontmatter."""
 
     @staticmethod
     def parse_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
-        """Parse YAML frontmatter from markdown content."""
+        """Parse YAML frontmatter from markdown content.
+
+        Results are cached by content hash and shared between callers, so the
+        returned frontmatter must not be mutated.
+        """
         if not content.startswith('---'):
             return {}, content
 
-        try:
-            # Find the end of frontmatter
-            end_idx = content.find('---', 3)
-            if end_idx == -1:
-                return {}, content
-
-            frontmatter_str = content[3:end_idx].strip()
-            body = content[end_idx + 3:].strip()
-
-            # Parse YAML
-            frontmatter = yaml.safe_load(frontmatter_str) or {}
+        key = FrontmatterCache.key(content)
+        document = frontmatter_cache.get(key)
+        if document is not None:
+            return document
 
-            return frontmatter, body
+        match = _FRONTMATTER.match(content)
+        if match is None:
+            return {}, content
+        try:
+            with metrics.stage_seconds.time("parse_frontmatter"):
+                frontmatter = yaml.load(match.group(1).strip(), Loader=YamlLoader) or {}
         except yaml.YAMLError:
             return {}, content
 
+        document = (frontmatter, content[match.end():].strip())
+        frontmatter_cache.put(key, document, len(content))
+        return document
+
     @staticmethod
-    def read_markdown_from_repository(
+    async def read_markdown_from_repository(
         repository: ContentRepository, relative_path: str
     ) -> tuple[Dict[str, Any], str]:
         """Read markdown content through the repository abstraction."""
         try:
-            content = repository.read_text(relative_path)
+            content = await repository.read_text(relative_path)
             return MarkdownReader.parse_frontmatter(content)
         except FileNotFoundError:
             return {}, ""
 
     @staticmethod
-    def load_bio_data(repository: ContentRepository) -> Bio:
-        """Load bio data from markdown files."""
-        bio_frontmatter, bio_content = MarkdownReader.read_markdown_from_repository(
+    async def load_profile(repository: ContentRepository) -> Dict[str, str]:
+        """Load the name, title, summary and about text from bio.md."""
+        bio_frontmatter, bio_content = await MarkdownReader.read_markdown_from_repository(
             repository, "bio.md"
         )
+        return {
+            "name": bio_frontmatter.get('name', ''),
+            "title": bio_frontmatter.get('title', ''),
+            "summary": bio_frontmatter.get('summary', ''),
+            "about": bio_content,
+        }
 
-        experience_frontmatter, _ = MarkdownReader.read_markdown_from_repository(
+    @staticmethod
+    async def load_experience(repository: ContentRepository) -> List[Experience]:
+        """Load work experience from experience.md."""
+        experience_frontmatter, _ = await MarkdownReader.read_markdown_from_repository(
             repository, "experience.md"
         )
 
-        education_frontmatter, _ = MarkdownReader.read_markdown_from_repository(
-            repository, "education.md"
-        )
-
-        talks_frontmatter, _ = MarkdownReader.read_markdown_from_repository(
-            repository, "talks.md"
-        )
-
-        publications_frontmatter, _ = MarkdownReader.read_markdown_from_repository(
-            repository, "publications.md"
-        )
-
-        # Create experience objects
         experiences = []
         for exp_data in experience_frontmatter.get('experiences', []):
             end_date_value = exp_data.get('end_date')
@@ -99,8 +160,15 @@ class MarkdownReader:
                 description_html=render_markdown(description_markdown),
                 technologies=exp_data.get('technologies', [])
             ))
+        return experiences
+
+    @staticmethod
+    async def load_education(repository: ContentRepository) -> List[Education]:
+        """Load education history from education.md."""
+        education_frontmatter, _ = await MarkdownReader.read_markdown_from_repository(
+            repository, "education.md"
+        )
 
-        # Create education objects
         educations = []
         for edu_data in education_frontmatter.get('education', []):
             end_date_value = edu_data.get('end_date')
@@ -119,8 +187,15 @@ class MarkdownReader:
                 start_date=edu_data['start_date'] if isinstance(edu_data['start_date'], date_type) else date_type.fromisoformat(edu_data['start_date']),
                 end_date=parsed_end_date
             ))
+        return educations
+
+    @staticmethod
+    async def load_talks(repository: ContentRepository) -> List[Talk]:
+        """Load public talks from talks.md."""
+        talks_frontmatter, _ = await MarkdownReader.read_markdown_from_repository(
+            repository, "talks.md"
+        )
 
-        # Create talks objects
         talks = []
         for talk_data in talks_frontmatter.get('talks', []):
             talk_date = talk_data.get('date')
@@ -143,8 +218,15 @@ class MarkdownReader:
                     description_html=render_markdown(description_md) if description_md else None,
                 )
             )
+        return talks
+
+    @staticmethod
+    async def load_publications(repository: ContentRepository) -> List[Publication]:
+        """Load publications from publications.md."""
+        publications_frontmatter, _ = await MarkdownReader.read_markdown_from_repository(
+            repository, "publications.md"
+        )
 
-        # Create publications objects
         publications = []
         for pub_data in publications_frontmatter.get('publications', []):
             pub_date = pub_data.get('date')
@@ -166,17 +248,27 @@ class MarkdownReader:
                     summary_html=render_markdown(summary_md) if summary_md else None,
                 )
             )
+        return publications
 
-        # Create bio object
-        bio = Bio(
-            name=bio_frontmatter.get('name', ''),
-            title=bio_frontmatter.get('title', ''),
-            summary=bio_frontmatter.get('summary', ''),
-            about=bio_content,
-            experience=experiences,
-            education=educations,
-            talks=talks,
-            publications=publications,
+    @staticmethod
+    async def load_bio_data(repository: ContentRepository) -> Bio:
+        """Load bio data from markdown files, fetching all sources concurrently."""
+        profile, experiences, educations, talks, publications = await asyncio.gather(
+            MarkdownReader.load_profile(repository),
+            MarkdownReader.load_experience(repository),
+            MarkdownReader.load_education(repository),
+            MarkdownReader.load_talks(repository),
+            MarkdownReader.load_publications(repository),
         )
 
+        # Create bio object
+        with metrics.stage_seconds.time("compose"):
+            bio = Bio(
+                **profile,
+                experience=experiences,
+                education=educations,
+                talks=talks,
+                publications=publications,
+            )
+
         return bio
@@ -33,6 +33,38 @@ class Settings(BaseModel):
         default=int(os.getenv("CONTENT_REFRESH_INTERVAL_SECONDS", "60")),
         description="Minimum seconds between remote content revalidation checks.",
     )
+    content_background_refresh: bool = Field(
+        default=os.getenv("CONTENT_BACKGROUND_REFRESH", "true").lower() in {"1", "true", "yes"},
+        description="Revalidate GitHub content in a background task instead of inline.",
+    )
+    content_refresh_jitter_seconds: float = Field(
+        default=float(os.getenv("CONTENT_REFRESH_JITTER_SECONDS", "5")),
+        description="Random delay added to each background refresh to spread load.",
+    )
+    content_watch: bool = Field(
+        default=os.getenv("CONTENT_WATCH", "true").lower() in {"1", "true", "yes"},
+        description="Watch local content for changes instead of stat()ing files on every read.",
+    )
+    content_watch_poll_interval_seconds: float = Field(
+        default=float(os.getenv("CONTENT_WATCH_POLL_INTERVAL_SECONDS", "1")),
+        description="Polling interval when filesystem events are unavailable.",
+    )
+    content_max_stale_seconds: int = Field(
+        default=int(os.getenv("CONTENT_MAX_STALE_SECONDS", "3600")),
+        description="Longest time content may be served without a successful revalidation.",
+    )
+    content_cache_dir: Path | None = Field(
+        default=Path(os.environ["CONTENT_CACHE_DIR"]) if os.getenv("CONTENT_CACHE_DIR") else None,
+        description="Optional directory for the persistent content cache used on cold starts.",
+    )
+    shared_content_path: Path | None = Field(
+        default=Path(os.environ["SHARED_CONTENT_PATH"]) if os.getenv("SHARED_CONTENT_PATH") else None,
+        description="Snapshot file shared by the workers of one host (e.g. under /dev/shm).",
+    )
+    shared_content_poll_interval_seconds: float = Field(
+        default=float(os.getenv("SHARED_CONTENT_POLL_INTERVAL_SECONDS", "0.5")),
+        description="How often workers publish or pick up the shared content snapshot.",
+    )
     local_content_path: Path = Field(
         default=Path(
             os.getenv(
@@ -42,6 +74,19 @@ class Settings(BaseModel):
         )
     )
 
+    markdown_render_cache_max_bytes: int = Field(
+        default=int(os.getenv("MARKDOWN_RENDER_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+        description="Memory budget for memoized markdown renders (approximate bytes).",
+    )
+    frontmatter_cache_max_bytes: int = Field(
+        default=int(os.getenv("FRONTMATTER_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+        description="Budget for parsed frontmatter, measured by source document size.",
+    )
+    api_compression_min_bytes: int = Field(
+        default=int(os.getenv("API_COMPRESSION_MIN_BYTES", "1024")),
+        description="Smallest API response body worth compressing.",
+    )
+
     github_repo: str | None = Field(
         default=os.getenv("CONTENT_GITHUB_REPO"),
         description="GitHub repo in the format owner/name containing markdown files.",
@@ -54,15 +99,54 @@ class Settings(BaseModel):
         default=os.getenv("CONTENT_GITHUB_SUBDIR", "backend/app/content/markdown"),
         description="Subdirectory inside the repo that contains markdown files.",
     )
+    github_sync_mode: str = Field(
+        default=os.getenv("CONTENT_GITHUB_SYNC_MODE", "files"),
+        description="'files' fetches each file on demand; 'archive' mirrors github_subdir from one tarball per commit.",
+    )
+    github_raw_base_url: str = Field(
+        default=os.getenv("CONTENT_GITHUB_RAW_URL", "https://raw.githubusercontent.com"),
+        description="Base URL for raw file downloads (override to point at a stub server).",
+    )
+    github_api_base_url: str = Field(
+        default=os.getenv("CONTENT_GITHUB_API_URL", "https://api.github.com"),
+        description="Base URL for the GitHub REST API (override to point at a stub server).",
+    )
     github_token: str | None = Field(
         default=os.getenv("CONTENT_GITHUB_TOKEN"),
         description="Optional GitHub token for private repos or higher rate limits.",
     )
 
+    inline_initial_content: bool = Field(
+        default=os.getenv("INLINE_INITIAL_CONTENT", "true").lower() in {"1", "true", "yes"},
+        description="Inline the current content and first blog page into index.html.",
+    )
+
+    prerender_pages: bool = Field(
+        default=os.getenv("PRERENDER_PAGES", "true").lower() in {"1", "true", "yes"},
+        description="Serve section and blog routes with pre-rendered HTML markup.",
+    )
+
+    metrics_enabled: bool = Field(
+        default=os.getenv("METRICS_ENABLED", "true").lower() in {"1", "true", "yes"},
+        description="Expose Prometheus metrics on /metrics and time content pipeline stages.",
+    )
+    profiling_token: str | None = Field(
+        default=os.getenv("PROFILING_TOKEN"),
+        description="Secret enabling the sampling profiler (X-Profile-Token header, /debug/profile).",
+    )
+    profiling_interval_seconds: float = Field(
+        default=float(os.getenv("PROFILING_INTERVAL_SECONDS", "0.005")),
+        description="Sampling interval of the request profiler.",
+    )
+
     reload_token: str | None = Field(
         default=os.getenv("CONTENT_RELOAD_TOKEN"),
         description="Optional secret token used to force content cache refreshes.",
     )
+    webhook_secret: str | None = Field(
+        default=os.getenv("CONTENT_WEBHOOK_SECRET"),
+        description="Secret for verifying GitHub push webhooks (X-Hub-Signature-256).",
+    )
 
 
 @lru_cache
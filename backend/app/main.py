@@ -3,22 +3,65 @@ Main FastAPI application for the professional bio website.
 """
 from contextlib import asynccontextmanager
 from pathlib import Path
+import asyncio
+import logging
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import content, blog
+from .content.bio_snapshot import BioSnapshot
 from .core.config import get_settings
+from .services import metrics
+from .services.blog_index import BlogIndex
+from .services.compression import CompressionMiddleware
+from .services.content_store import (
+    bio_snapshots,
+    blog_index,
+    content_cache,
+    content_refresher,
+    content_repository,
+    content_watcher,
+    shared_content,
+)
+from .services.index_page import ROUTE_SECTIONS, Bootstrap, PageRenderer
+from .services.markdown_renderer import render_cache
+from .services.prerender import SECTION_PAGES, PagePrerenderer
+from .services.profiler import ProfileStore, ProfilingMiddleware
+from .services.static_assets import StaticAsset, StaticAssetManifest
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+MAX_PROFILE_SECONDS = 60.0
+# Routes whose pages are rebuilt off the request path whenever content changes.
+WARM_ROUTES = ("", *SECTION_PAGES, "blog")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan context manager."""
     # Startup
+    frontend_assets.build()
+    restored = content_cache.restore(content_repository, bio_snapshots)
+
+    def own_refreshes() -> None:
+        # Content restored from disk or taken over from another worker may be stale.
+        content_refresher.start(refresh_now=restored or shared_content.generation > 0)
+        content_watcher.start()
+
+    shared_content.start(own_refreshes)
+    warm_pages = asyncio.create_task(warm_frontend_pages(), name="warm-frontend-pages")
     yield
     # Shutdown
+    warm_pages.cancel()
+    await content_refresher.stop()
+    await content_watcher.stop()
+    await shared_content.stop()
+    content_cache.save(content_repository, bio_snapshots)
+    await content_repository.aclose()
 
 
 settings = get_settings()
@@ -39,9 +82,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress other API responses; pre-serialized payloads arrive already encoded.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.api_compression_min_bytes,
+    path_prefix="/api",
+)
+
+# Sampling profiler for requests with X-Profile-Token; not installed without a token.
+profiles = ProfileStore(settings.profiling_token, settings.profiling_interval_seconds)
+if profiles.enabled:
+    app.add_middleware(ProfilingMiddleware, store=profiles)
+
 # Static files
 static_path = Path(__file__).parent / "static"
 frontend_path = static_path / "web"
+frontend_assets = StaticAssetManifest(frontend_path)
+page_renderer = PageRenderer()
+page_prerenderer = PagePrerenderer()
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
 # API routes
@@ -74,34 +132,149 @@ async def health_check():
     return {"status": "healthy"}
 
 
-def _frontend_index() -> Path:
-    index_file = frontend_path / "index.html"
-    if not index_file.exists():
+def _cache_metrics():
+    stats = render_cache.stats()
+    yield ("markdown_render_cache_entries", "gauge", "Cached rendered markdown fragments.", [({}, stats["entries"])])
+    yield ("markdown_render_cache_bytes", "gauge", "Approximate size of the render cache.", [({}, stats["bytes"])])
+    yield (
+        "markdown_render_cache_lookups_total",
+        "counter",
+        "Render cache lookups by result.",
+        [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])],
+    )
+    yield (
+        "shared_content_leader",
+        "gauge",
+        "1 if this worker owns content refreshes for the shared snapshot.",
+        [({}, int(shared_content.leader or not shared_content.enabled))],
+    )
+
+
+metrics.registry.add_collector(_cache_metrics)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus metrics for this worker process."""
+    if not metrics.registry.enabled:
+        raise HTTPException(status_code=404, detail="Metrics not enabled")
+    return PlainTextResponse(metrics.registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def _profile_response(profiler) -> PlainTextResponse:
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={
+            "X-Profile-Id": profiler.id,
+            "X-Profile-Samples": str(sum(profiler.samples.values())),
+            "X-Profile-Duration": f"{profiler.duration:.3f}",
+        },
+    )
+
+
+def _check_profile_token(token: str | None) -> None:
+    if not profiles.enabled:
+        raise HTTPException(status_code=404, detail="Profiling not enabled")
+    if not profiles.authorized(token):
+        raise HTTPException(status_code=403, detail="Invalid profile token")
+
+
+@app.get("/debug/profile", include_in_schema=False)
+async def profile_window(
+    seconds: float = Query(default=10.0, gt=0, le=MAX_PROFILE_SECONDS),
+    x_profile_token: str | None = Header(default=None),
+):
+    """Sample this worker for a time window and return collapsed stacks (requires PROFILING_TOKEN)."""
+    _check_profile_token(x_profile_token)
+    profiler = profiles.begin()
+    if profiler is None:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        await profiles.end(profiler)
+    return _profile_response(profiler)
+
+
+@app.get("/debug/profiles/{profile_id}", include_in_schema=False)
+async def stored_profile(profile_id: str, x_profile_token: str | None = Header(default=None)):
+    """Collapsed stacks of a profiled request, by its X-Profile-Id."""
+    _check_profile_token(x_profile_token)
+    profiler = profiles.get(profile_id)
+    if profiler is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return _profile_response(profiler)
+
+
+async def _render_page(
+    route: str, index: StaticAsset, snapshot: BioSnapshot, blog: BlogIndex
+) -> StaticAsset:
+    markup = (
+        await page_prerenderer.markup(route, snapshot, blog) if settings.prerender_pages else None
+    )
+    bootstrap = (
+        Bootstrap.for_route(route, snapshot, blog) if settings.inline_initial_content else None
+    )
+    if markup is None and route not in ROUTE_SECTIONS:
+        # Other routes share one shell and the client router handles them.
+        page_renderer.discard(route)
+        route = "*"
+    return await page_renderer.render(route, index, bootstrap, markup)
+
+
+async def warm_frontend_pages() -> None:
+    """Rebuild the pages of the fixed routes after content changes, before they are requested."""
+    index = frontend_assets.index
+    if index is None or not (settings.inline_initial_content or settings.prerender_pages):
+        return
+    try:
+        snapshot = await bio_snapshots.get()
+        blog = await blog_index.get()
+        for route in WARM_ROUTES:
+            await _render_page(route, index, snapshot, blog)
+    except Exception:
+        # Requests still build pages themselves (or serve the plain shell).
+        logger.exception("Could not pre-build frontend pages")
+
+
+content_refresher.add_listener(warm_frontend_pages)
+content_watcher.add_listener(warm_frontend_pages)
+
+
+async def _frontend_page(request: Request, route: str = ""):
+    index = frontend_assets.index
+    if index is None:
         raise HTTPException(status_code=404, detail="Frontend build not found")
-    return index_file
+    if not (settings.inline_initial_content or settings.prerender_pages):
+        return index.response(request)
 
+    try:
+        snapshot = await bio_snapshots.get()
+        blog = await blog_index.get()
+    except Exception:
+        # Content is unavailable (e.g. GitHub errors or invalid markdown). The plain
+        # shell still works; the app falls back to API calls. Rendering bugs below
+        # are not caught, so they fail loudly instead of silently serving the shell.
+        logger.exception("Could not load content for /%s", route)
+        return index.response(request)
 
-def _resolve_frontend_asset(path_fragment: str) -> Path | None:
-    target = (frontend_path / path_fragment).resolve()
-    if frontend_path.exists() and target.is_file():
-        if str(target).startswith(str(frontend_path.resolve())):
-            return target
-    return None
+    page = await _render_page(route, index, snapshot, blog)
+    return page.response(request)
 
 
 @app.get("/", include_in_schema=False)
-async def serve_frontend_root():
+async def serve_frontend_root(request: Request):
     """Serve the compiled React application."""
-    return FileResponse(_frontend_index())
+    return await _frontend_page(request)
 
 
 @app.get("/{full_path:path}", include_in_schema=False)
-async def serve_frontend_app(full_path: str):
+async def serve_frontend_app(full_path: str, request: Request):
     """Serve frontend assets or fall back to index.html for client-side routes."""
     if full_path.startswith("api"):
         raise HTTPException(status_code=404, detail="Endpoint not found")
 
-    asset = _resolve_frontend_asset(full_path)
+    asset = frontend_assets.get(full_path)
     if asset:
-        return FileResponse(asset)
-    return FileResponse(_frontend_index())
+        return asset.response(request)
+    return await _frontend_page(request, full_path.strip("/"))
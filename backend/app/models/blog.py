@@ -2,16 +2,18 @@
 Blog data models using Pydantic.
 """
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
 class BlogPost(BaseModel):
     """Blog post model."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique post identifier")
     title: str = Field(..., description="Post title")
     slug: str = Field(..., description="URL-friendly slug")
-    medium_url: str = Field(..., description="Medium article URL")
+    medium_url: Optional[str] = Field(None, description="Medium article URL")
     excerpt: str = Field(..., description="Post excerpt/summary")
     author: str = Field(..., description="Post author")
     published_at: datetime = Field(..., description="Publication date")
@@ -20,3 +22,4 @@ class BlogPost(BaseModel):
     thumbnail_url: Optional[str] = Field(None, description="Thumbnail image URL")
     featured: bool = Field(default=False, description="Whether this is a featured post")
     published: bool = Field(default=True, description="Whether post is published")
+    content_html: Optional[str] = Field(None, description="Rendered post body (single-post responses only)")
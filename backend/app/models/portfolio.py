@@ -2,7 +2,7 @@
 Portfolio data models using Pydantic.
 """
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import date as date_type
 
 
@@ -15,6 +15,8 @@ class Skill(BaseModel):
 
 class Experience(BaseModel):
     """Work experience model."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique experience identifier")
     company: str = Field(..., description="Company name")
     position: str = Field(..., description="Job position/title")
@@ -27,6 +29,8 @@ class Experience(BaseModel):
 
 class Education(BaseModel):
     """Education model."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique education identifier")
     institution: str = Field(..., description="Institution name")
     degree: str = Field(..., description="Degree obtained")
@@ -38,6 +42,8 @@ class Education(BaseModel):
 
 class Talk(BaseModel):
     """Public talk / presentation model."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique talk identifier")
     title: str = Field(..., description="Talk title")
     event: str = Field(..., description="Event or conference name")
@@ -51,6 +57,8 @@ class Talk(BaseModel):
 
 class Publication(BaseModel):
     """Scientific publication model."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique publication identifier")
     title: str = Field(..., description="Publication title")
     venue: str = Field(..., description="Conference or journal name")
@@ -63,6 +71,8 @@ class Publication(BaseModel):
 
 class Bio(BaseModel):
     """Bio/About information model."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Full name")
     title: str = Field(..., description="Professional title")
     summary: str = Field(..., description="Professional summary")
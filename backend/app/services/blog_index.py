@@ -0,0 +1,175 @@
+"""
+Indexed in-memory view of published blog posts.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Sequence, Tuple
+import hashlib
+
+from ..models.blog import BlogPost
+from .http_cache import SerializedPayload
+from .markdown_renderer import render_markdown
+from .single_flight import SingleFlight
+
+PostTuple = Tuple[BlogPost, ...]
+
+# A post paired with its unrendered markdown body.
+BlogEntry = Tuple[BlogPost, str]
+
+
+@dataclass(frozen=True)
+class BlogIndex:
+    """Published posts, newest first, with precomputed lookup tables."""
+
+    version: Hashable
+    posts: PostTuple
+    by_id: Dict[str, BlogPost]
+    by_slug: Dict[str, BlogPost]
+    by_tag: Dict[str, PostTuple]
+    by_featured: Dict[bool, PostTuple]
+    by_tag_featured: Dict[Tuple[str, bool], PostTuple]
+    tags: Tuple[str, ...]
+    # Bodies and rendered posts are keyed by id() of the indexed post object.
+    _bodies: Dict[int, str] = field(default_factory=dict, compare=False, repr=False)
+    _full_posts: Dict[int, BlogPost] = field(default_factory=dict, compare=False, repr=False)
+    _listings: Dict[int, SerializedPayload] = field(default_factory=dict, compare=False, repr=False)
+    _post_versions: Dict[int, str] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def build(cls, entries: Iterable[BlogEntry], version: Hashable) -> "BlogIndex":
+        published = [(post, body) for post, body in entries if post.published]
+        published.sort(key=lambda entry: entry[0].published_at, reverse=True)
+        ordered = [post for post, _ in published]
+        by_id: Dict[str, BlogPost] = {}
+        by_slug: Dict[str, BlogPost] = {}
+        by_tag: Dict[str, List[BlogPost]] = {}
+        by_featured: Dict[bool, List[BlogPost]] = {True: [], False: []}
+        by_tag_featured: Dict[Tuple[str, bool], List[BlogPost]] = {}
+        for post in ordered:
+            # Lookups return the newest post when ids or slugs collide.
+            by_id.setdefault(post.id, post)
+            by_slug.setdefault(post.slug, post)
+            by_featured[post.featured].append(post)
+            for tag in dict.fromkeys(post.tags):
+                by_tag.setdefault(tag, []).append(post)
+                by_tag_featured.setdefault((tag, post.featured), []).append(post)
+
+        return cls(
+            version=version,
+            posts=tuple(ordered),
+            by_id=by_id,
+            by_slug=by_slug,
+            by_tag={tag: tuple(items) for tag, items in by_tag.items()},
+            by_featured={key: tuple(items) for key, items in by_featured.items()},
+            by_tag_featured={key: tuple(items) for key, items in by_tag_featured.items()},
+            tags=tuple(sorted(by_tag)),
+            _bodies={id(post): body for post, body in published},
+        )
+
+    def full_post(self, post: BlogPost) -> BlogPost:
+        """Return the post with its body rendered, rendering it at most once per index."""
+        key = id(post)
+        full = self._full_posts.get(key)
+        if full is None:
+            body = self._bodies.get(key, "")
+            full = post.model_copy(
+                update={"content_html": render_markdown(body) if body else None}
+            )
+            self._full_posts[key] = full
+        return full
+
+    def post_version(self, post: BlogPost) -> str:
+        """Return a digest of the post's metadata and body, stable across rebuilds."""
+        key = id(post)
+        version = self._post_versions.get(key)
+        if version is None:
+            digest = hashlib.sha256(post.model_dump_json().encode("utf-8"))
+            digest.update(self._bodies.get(key, "").encode("utf-8"))
+            version = digest.hexdigest()
+            self._post_versions[key] = version
+        return version
+
+    def first_page_payload(self, limit: int = 10) -> SerializedPayload:
+        """Serialize the unfiltered first page of the listing, once per index."""
+        payload = self._listings.get(limit)
+        if payload is None:
+            payload = SerializedPayload.from_object({
+                "posts": self.posts[:limit],
+                "total": len(self.posts),
+                "limit": limit,
+                "offset": 0,
+            })
+            self._listings[limit] = payload
+        return payload
+
+    def seed_first_page(self, payload: SerializedPayload, limit: int = 10) -> None:
+        """Reuse an already serialized first page (e.g. from a shared snapshot)."""
+        self._listings[limit] = payload
+
+    def entries(self) -> List[BlogEntry]:
+        """Return the published posts with their unrendered bodies, newest first."""
+        return [(post, self._bodies.get(id(post), "")) for post in self.posts]
+
+    def select(self, tag: str | None = None, featured: bool | None = None) -> Sequence[BlogPost]:
+        """Return the posts matching the filters, newest first."""
+        if tag is not None and featured is not None:
+            return self.by_tag_featured.get((tag, featured), ())
+        if tag is not None:
+            return self.by_tag.get(tag, ())
+        if featured is not None:
+            return self.by_featured[featured]
+        return self.posts
+
+
+class BlogIndexCache:
+    """Rebuilds the BlogIndex only when the source content version changes.
+
+    Computing the source version touches every post, so while something else
+    reports content changes (``changes_pushed``), requests serve the cached
+    index and only ``refresh()``, run by those reporters, checks the version.
+    """
+
+    def __init__(
+        self,
+        source_version: Callable[[], Awaitable[Hashable]],
+        load_entries: Callable[[], Awaitable[List[BlogEntry]]],
+        changes_pushed: Callable[[], bool] = lambda: False,
+    ):
+        self._source_version = source_version
+        self._load_entries = load_entries
+        self._changes_pushed = changes_pushed
+        self._index: BlogIndex | None = None
+        # Whether the index was last checked while changes were being pushed.
+        self._trusted = False
+        # Concurrent requests for the same source version share one rebuild.
+        self._flights = SingleFlight()
+
+    async def get(self) -> BlogIndex:
+        index = self._index
+        if index is not None and self._trusted and self._changes_pushed():
+            return index
+        return await self.refresh()
+
+    async def refresh(self) -> BlogIndex:
+        """Rebuild the index if the source version changed since it was built."""
+        # Any change after this point is reported through another refresh().
+        self._trusted = self._changes_pushed()
+        version = await self._source_version()
+        index = self._index
+        if index is not None and index.version == version:
+            return index
+        return await self._flights.run(version, lambda: self._build(version))
+
+    async def _build(self, version: Hashable) -> BlogIndex:
+        index = BlogIndex.build(await self._load_entries(), version)
+        self._index = index
+        return index
+
+    def seed(self, index: BlogIndex) -> None:
+        """Install an index built elsewhere (e.g. by another worker)."""
+        self._index = index
+        self._trusted = self._changes_pushed()
+
+    def invalidate(self) -> None:
+        self._index = None
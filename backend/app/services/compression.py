@@ -0,0 +1,185 @@
+"""
+Content-encoding negotiation, compression helpers and API compression middleware.
+"""
+from typing import Callable, Dict, Iterable, List
+import gzip
+
+try:  # Optional dependency: brotli is used when installed.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+try:  # Python 3.14+ ships zstd in the standard library.
+    from compression import zstd as _zstd
+
+    def _zstd_compress(data: bytes, level: int) -> bytes:
+        return _zstd.compress(data, level=level)
+except ImportError:  # pragma: no cover - depends on the environment
+    try:  # Optional dependency: zstandard is used when installed.
+        import zstandard
+    except ImportError:
+        zstandard = None
+
+    def _zstd_compress(data: bytes, level: int) -> bytes:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+    _zstd = zstandard
+
+Compressor = Callable[[bytes], bytes]
+
+# Maximum ratio, for bodies that are compressed once and then served many times.
+COMPRESSORS: Dict[str, Compressor] = {
+    "gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+}
+# Cheaper settings for bodies compressed on every response.
+FAST_COMPRESSORS: Dict[str, Compressor] = {
+    "gzip": lambda data: gzip.compress(data, compresslevel=6, mtime=0),
+}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda data: brotli.compress(data, quality=11)
+    FAST_COMPRESSORS["br"] = lambda data: brotli.compress(data, quality=4)
+if _zstd is not None:
+    COMPRESSORS["zstd"] = lambda data: _zstd_compress(data, 19)
+    FAST_COMPRESSORS["zstd"] = lambda data: _zstd_compress(data, 3)
+
+# Server preference when the client accepts several encodings equally.
+ENCODING_PREFERENCE = ("br", "zstd", "gzip")
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def parse_accept_encoding(header: str | None) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}."""
+    accepted: Dict[str, float] = {}
+    if not header:
+        return accepted
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate_encoding(header: str | None, available: Iterable[str]) -> str | None:
+    """Pick the best available encoding the client accepts, or None for identity."""
+    accepted = parse_accept_encoding(header)
+    if not accepted:
+        return None
+    available = set(available)
+    best: str | None = None
+    best_quality = 0.0
+    for coding in ENCODING_PREFERENCE:
+        if coding not in available:
+            continue
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def encoded_etag(etag: str, coding: str | None) -> str:
+    """Give each content-coding its own validator, as the bytes differ."""
+    if coding is None or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{coding}"'
+
+
+class CompressionMiddleware:
+    """Compress single-chunk responses under a path prefix.
+
+    Responses that already carry a Content-Encoding (such as precompressed
+    payloads) and streaming responses are passed through untouched.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, path_prefix: str = "/api"):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        coding = negotiate_encoding(accept_encoding, FAST_COMPRESSORS)
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Dict | None = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            body = message.get("body", b"")
+            headers = _header_dict(start_message["headers"])
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or b"content-encoding" in headers
+                or not headers.get(b"content-type", b"").decode("latin-1").startswith(COMPRESSIBLE_TYPES)
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = FAST_COMPRESSORS[coding](body)
+            raw_headers = [
+                (name, value)
+                for name, value in start_message["headers"]
+                if name not in (b"content-length", b"etag", b"vary")
+            ]
+            raw_headers += [
+                (b"content-encoding", coding.encode("latin-1")),
+                (b"content-length", str(len(compressed)).encode("latin-1")),
+                (b"vary", _vary_with_accept_encoding(headers.get(b"vary"))),
+            ]
+            if b"etag" in headers:
+                etag = encoded_etag(headers[b"etag"].decode("latin-1"), coding)
+                raw_headers.append((b"etag", etag.encode("latin-1")))
+            await send({**start_message, "headers": raw_headers})
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _header_dict(raw_headers: List[tuple]) -> Dict[bytes, bytes]:
+    return {name.lower(): value for name, value in raw_headers}
+
+
+def _vary_with_accept_encoding(vary: bytes | None) -> bytes:
+    if not vary:
+        return b"Accept-Encoding"
+    if b"accept-encoding" in vary.lower():
+        return vary
+    return vary + b", Accept-Encoding"
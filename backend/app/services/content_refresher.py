@@ -0,0 +1,81 @@
+"""
+Background stale-while-revalidate refresher for remote content.
+"""
+from __future__ import annotations
+
+from typing import Awaitable, Callable, List
+import asyncio
+import logging
+import random
+
+from ..core.config import Settings
+from .content_repository import ContentRepository
+
+logger = logging.getLogger(__name__)
+
+RefreshListener = Callable[[], Awaitable[object]]
+
+
+class ContentRefresher:
+    """Periodically revalidates the repository cache off the request path."""
+
+    def __init__(self, repository: ContentRepository, settings: Settings):
+        self.repository = repository
+        self.settings = settings
+        self._listeners: List[RefreshListener] = []
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.repository.source == "github" and self.settings.content_background_refresh
+
+    def add_listener(self, listener: RefreshListener) -> None:
+        """Register a coroutine to run after every refresh (e.g. cache warmers)."""
+        self._listeners.append(listener)
+
+    def start(self, refresh_now: bool = False) -> None:
+        """Start the refresh loop and let requests serve cached content.
+
+        ``refresh_now`` runs the first revalidation immediately, e.g. after
+        restoring content from the persistent cache.
+        """
+        if not self.enabled or self._task is not None:
+            return
+        self.repository.background_refresh = True
+        self._task = asyncio.create_task(self._run(refresh_now), name="content-refresher")
+
+    async def stop(self) -> None:
+        """Cancel the refresh loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.repository.background_refresh = False
+
+    async def refresh_once(self) -> None:
+        """Revalidate cached content, then notify listeners."""
+        await self.repository.revalidate()
+        await self.notify()
+
+    async def notify(self) -> None:
+        """Run the listeners, e.g. after content was refreshed out of band."""
+        for listener in self._listeners:
+            await listener()
+
+    def _next_delay(self) -> float:
+        jitter = random.uniform(0, max(self.settings.content_refresh_jitter_seconds, 0))
+        return max(self.settings.content_refresh_interval_seconds, 1) + jitter
+
+    async def _run(self, refresh_now: bool) -> None:
+        delay = 0.0 if refresh_now else self._next_delay()
+        while True:
+            await asyncio.sleep(delay)
+            delay = self._next_delay()
+            try:
+                await self.refresh_once()
+            except Exception:
+                logger.exception("Background content refresh failed")
@@ -3,14 +3,28 @@ Content repository responsible for retrieving markdown files from local disk or
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List
+import asyncio
+import hashlib
+import io
+import logging
+import tarfile
 import time
 
 import httpx
 
 from ..core.config import Settings
+from . import metrics
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def content_etag(raw: bytes) -> str:
+    """Validator derived from the bytes themselves, for sources without ETags."""
+    return f'"{hashlib.sha1(raw).hexdigest()}"'
 
 
 @dataclass
@@ -22,6 +36,15 @@ class CachedFile:
     mtime: float | None = None
     last_checked: float = time.time()
 
+    @property
+    def version(self) -> str:
+        """Opaque token that changes whenever the cached content changes."""
+        if self.etag:
+            return self.etag
+        if self.mtime is not None:
+            return repr(self.mtime)
+        return hashlib.sha1(self.content.encode("utf-8")).hexdigest()
+
 
 @dataclass
 class CachedDirectory:
@@ -40,30 +63,159 @@ class ContentRepository:
         self.source = (settings.content_source or "local").lower()
         if self.source not in {"local", "github"}:
             raise ValueError("CONTENT_SOURCE must be 'local' or 'github'.")
+        self.sync_mode = (settings.github_sync_mode or "files").lower()
+        if self.sync_mode not in {"files", "archive"}:
+            raise ValueError("CONTENT_GITHUB_SYNC_MODE must be 'files' or 'archive'.")
         self._file_cache: Dict[str, CachedFile] = {}
         self._dir_cache: Dict[str, CachedDirectory] = {}
-        self._client = httpx.Client(timeout=10)
-
-    def read_text(self, relative_path: str) -> str:
+        self._client: httpx.AsyncClient | None = None
+        self.background_refresh = False
+        # Set while a filesystem watcher pushes invalidations for local content.
+        self.watching = False
+        # Set while another worker owns refreshes and publishes its cache to this one.
+        self.follower = False
+        self._head_sha: str | None = None
+        self._head_etag: str | None = None
+        self._head_checked = 0.0
+        # Concurrent misses for the same file, listing or archive share one fetch.
+        self._flights = SingleFlight()
+
+    @property
+    def changes_pushed(self) -> bool:
+        """True while a watcher, the background refresher or a leader worker reports changes."""
+        return self.watching or self.follower or self.background_refresh
+
+    async def read_text(self, relative_path: str) -> str:
         """Read markdown text for the provided relative path."""
         normalized_path = self._normalize_relative_path(relative_path)
-        if self.source == "github":
-            return self._read_text_from_github(normalized_path)
-        return self._read_text_from_disk(normalized_path)
+        with metrics.stage_seconds.time("repository_read"):
+            if self.source == "github":
+                return await self._read_text_from_github(normalized_path)
+            return self._read_text_from_disk(normalized_path)
 
-    def list_markdown_files(self, relative_dir: str) -> List[str]:
+    async def list_markdown_files(self, relative_dir: str) -> List[str]:
         """List markdown file names inside the provided directory."""
         normalized_dir = self._normalize_relative_path(relative_dir, allow_directory=True)
         if self.source == "github":
-            return self._list_files_from_github(normalized_dir)
+            return await self._list_files_from_github(normalized_dir)
         return self._list_files_from_disk(normalized_dir)
 
+    async def file_version(self, relative_path: str) -> str | None:
+        """Return the content version of a file (mtime locally, ETag on GitHub).
+
+        Returns None when the file does not exist.
+        """
+        normalized_path = self._normalize_relative_path(relative_path)
+        try:
+            await self.read_text(normalized_path)
+        except FileNotFoundError:
+            return None
+        return self._file_cache[normalized_path].version
+
     def clear_cache(self) -> None:
         """Clear cached file and directory metadata."""
         self._file_cache.clear()
         self._dir_cache.clear()
-        self._client.close()
-        self._client = httpx.Client(timeout=10)
+        self._head_sha = None
+        self._head_etag = None
+        self._head_checked = 0.0
+
+    def invalidate_paths(self, relative_paths: Iterable[str]) -> None:
+        """Drop cached entries for changed paths and the listings that contain them."""
+        for relative_path in relative_paths:
+            path = relative_path.strip("/")
+            self._file_cache.pop(path, None)
+            self._dir_cache.pop(path, None)
+            self._dir_cache.pop(path.rpartition("/")[0], None)
+            # A renamed or deleted directory takes its files with it.
+            prefix = path + "/"
+            for cached_path in [key for key in self._file_cache if key.startswith(prefix)]:
+                del self._file_cache[cached_path]
+
+    def export_state(self) -> Dict[str, Any]:
+        """Return cached files, listings and validators as JSON-compatible data."""
+        return {
+            "files": {path: asdict(entry) for path, entry in self._file_cache.items()},
+            "directories": {path: asdict(entry) for path, entry in self._dir_cache.items()},
+            "head": {
+                "sha": self._head_sha,
+                "etag": self._head_etag,
+                "checked": self._head_checked,
+            },
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace the caches with previously exported data."""
+        self._file_cache = {
+            path: CachedFile(**entry) for path, entry in state["files"].items()
+        }
+        self._dir_cache = {
+            path: CachedDirectory(**entry) for path, entry in state["directories"].items()
+        }
+        head = state.get("head") or {}
+        self._head_sha = head.get("sha")
+        self._head_etag = head.get("etag")
+        self._head_checked = head.get("checked") or 0.0
+
+    async def revalidate(self) -> None:
+        """Revalidate every cached GitHub entry and swap in fresh copies.
+
+        Entries that fail to revalidate keep serving their previous content.
+        """
+        if self.source != "github":
+            return
+        if self.sync_mode == "archive":
+            try:
+                await self._sync_github_archive(force=True)
+            except Exception as exc:
+                logger.warning("Failed to sync content archive: %s", exc)
+            return
+        await self._refetch(list(self._file_cache), list(self._dir_cache))
+
+    async def refresh_paths(self, relative_paths: Iterable[str], ref: str | None = None) -> None:
+        """Refetch only the given changed files and the listings that contain them.
+
+        ``ref`` pins file downloads to a commit, so a CDN copy of the branch
+        that predates the change cannot be served. Entries that fail to refresh
+        are marked stale, so the next read fetches them inline.
+        """
+        paths = {path.strip("/") for path in relative_paths if path.strip("/")}
+        if not paths:
+            return
+        if self.source != "github":
+            self.invalidate_paths(paths)
+            return
+        if self.sync_mode == "archive":
+            await self._sync_github_archive(force=True)
+            return
+        file_keys = [path for path in paths if path in self._file_cache]
+        dir_keys = sorted({path.rpartition("/")[0] for path in paths} & self._dir_cache.keys())
+        await self._refetch(file_keys, dir_keys, ref=ref, expire_failed=True)
+
+    async def _refetch(
+        self,
+        file_keys: List[str],
+        dir_keys: List[str],
+        ref: str | None = None,
+        expire_failed: bool = False,
+    ) -> None:
+        results = await asyncio.gather(
+            *(self._refresh_file(key, ref) for key in file_keys),
+            *(self._refresh_directory(key) for key in dir_keys),
+            return_exceptions=True,
+        )
+        for index, (key, result) in enumerate(zip(file_keys + dir_keys, results)):
+            if isinstance(result, BaseException) and not isinstance(result, FileNotFoundError):
+                logger.warning("Failed to revalidate %s: %s", key, result)
+                cache = self._file_cache if index < len(file_keys) else self._dir_cache
+                if expire_failed and key in cache:
+                    cache[key] = replace(cache[key], last_checked=0.0)
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     # Internal helpers -----------------------------------------------------
 
@@ -80,23 +232,38 @@ class ContentRepository:
     # Local filesystem operations -----------------------------------------
 
     def _read_text_from_disk(self, relative_path: str) -> str:
+        cached = self._file_cache.get(relative_path)
+        if cached and (self.watching or self.follower):
+            # The watcher evicts changed files, so a cached entry is current.
+            metrics.repository_cache.inc("file", "hit")
+            return cached.content
+
         base_path = self.settings.local_content_path
         full_path = (base_path / relative_path).resolve()
         if not str(full_path).startswith(str(base_path.resolve())):
             raise FileNotFoundError("Access outside of content directory is forbidden.")
 
-        cached = self._file_cache.get(relative_path)
         mtime = full_path.stat().st_mtime if full_path.exists() else None
         if cached and mtime and cached.mtime == mtime:
+            metrics.repository_cache.inc("file", "hit")
             return cached.content
 
-        content = full_path.read_text(encoding="utf-8")
+        metrics.repository_cache.inc("file", "miss")
+        raw = full_path.read_bytes()
+        content = raw.decode("utf-8")
+        # Versions follow the bytes, so touching a file does not invalidate anything.
         self._file_cache[relative_path] = CachedFile(
-            content=content, mtime=mtime, last_checked=time.time()
+            content=content, etag=content_etag(raw), mtime=mtime, last_checked=time.time()
         )
         return content
 
     def _list_files_from_disk(self, relative_dir: str) -> List[str]:
+        cached = self._dir_cache.get(relative_dir)
+        if cached and (self.watching or self.follower):
+            metrics.repository_cache.inc("directory", "hit")
+            return list(cached.files)
+        metrics.repository_cache.inc("directory", "miss")
+
         base_path = self.settings.local_content_path
         directory = (base_path / relative_dir).resolve()
         if not directory.exists():
@@ -105,78 +272,252 @@ class ContentRepository:
             raise FileNotFoundError("Access outside of content directory is forbidden.")
 
         files = [entry.name for entry in directory.iterdir() if entry.is_file()]
-        return files
+        if self.watching:
+            self._dir_cache[relative_dir] = CachedDirectory(
+                files=files, last_checked=time.time()
+            )
+        return list(files)
 
     # GitHub operations ----------------------------------------------------
 
-    def _read_text_from_github(self, relative_path: str) -> str:
-        cached = self._file_cache.get(relative_path)
-        now = time.time()
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=10,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=120,
+                ),
+            )
+        return self._client
+
+    async def _github_get(self, kind: str, url: str, **kwargs: Any) -> httpx.Response:
+        """GET from GitHub, counting requests by kind and response status."""
+        try:
+            response = await self._http_client().get(url, **kwargs)
+        except httpx.HTTPError:
+            metrics.github_requests.inc(kind, "error")
+            raise
+        metrics.github_requests.inc(kind, str(response.status_code))
+        return response
+
+    def _is_fresh(self, last_checked: float, now: float) -> bool:
+        if self.follower:
+            # The leader worker revalidates and republishes; only misses go upstream.
+            return True
+        # With a background refresher running, requests are served from memory
+        # until entries exceed the staleness cap (e.g. while GitHub is down).
+        if self.background_refresh:
+            return now - last_checked < self.settings.content_max_stale_seconds
+        return now - last_checked < self.settings.content_refresh_interval_seconds
+
+    async def _read_text_from_github(self, relative_path: str) -> str:
+        if self.sync_mode == "archive":
+            synced = await self._sync_github_archive()
+            metrics.repository_cache.inc("file", "miss" if synced else "hit")
+            cached = self._file_cache.get(relative_path)
+            if cached is None:
+                raise FileNotFoundError(relative_path)
+            return cached.content
 
-        if cached and now - cached.last_checked < self.settings.content_refresh_interval_seconds:
+        cached = self._file_cache.get(relative_path)
+        if cached and self._is_fresh(cached.last_checked, time.time()):
+            metrics.repository_cache.inc("file", "hit")
             return cached.content
 
+        metrics.repository_cache.inc("file", "miss")
+        refreshed = await self._refresh_file(relative_path)
+        return refreshed.content
+
+    async def _refresh_file(self, relative_path: str, ref: str | None = None) -> CachedFile:
+        """Fetch a file into the cache, sharing one request between concurrent callers."""
+
+        async def fetch() -> CachedFile:
+            try:
+                refreshed = await self._fetch_file_from_github(
+                    relative_path, self._file_cache.get(relative_path), ref=ref
+                )
+            except FileNotFoundError:
+                self._file_cache.pop(relative_path, None)
+                raise
+            self._file_cache[relative_path] = refreshed
+            return refreshed
+
+        return await self._flights.run(("file", relative_path, ref), fetch)
+
+    async def _fetch_file_from_github(
+        self, relative_path: str, cached: CachedFile | None, ref: str | None = None
+    ) -> CachedFile:
+        now = time.time()
         headers = {}
         if cached and cached.etag:
             headers["If-None-Match"] = cached.etag
 
-        url = self._github_raw_url(relative_path)
-        response = self._client.get(url, headers=self._auth_headers(headers))
+        url = self._github_raw_url(relative_path, ref)
+        response = await self._github_get("file", url, headers=self._auth_headers(headers))
 
         if response.status_code == httpx.codes.NOT_MODIFIED and cached:
-            cached.last_checked = now
-            return cached.content
+            return replace(cached, last_checked=now)
+        if response.status_code == httpx.codes.NOT_FOUND:
+            raise FileNotFoundError(relative_path)
 
         response.raise_for_status()
-        content = response.text
-        etag = response.headers.get("ETag")
-
-        self._file_cache[relative_path] = CachedFile(
-            content=content,
-            etag=etag,
+        return CachedFile(
+            content=response.text,
+            etag=response.headers.get("ETag"),
             last_checked=now,
         )
-        return content
 
-    def _list_files_from_github(self, relative_dir: str) -> List[str]:
+    async def _list_files_from_github(self, relative_dir: str) -> List[str]:
+        if self.sync_mode == "archive":
+            synced = await self._sync_github_archive()
+            metrics.repository_cache.inc("directory", "miss" if synced else "hit")
+            cached = self._dir_cache.get(relative_dir)
+            return cached.files if cached else []
+
         cached = self._dir_cache.get(relative_dir)
-        now = time.time()
-        if cached and now - cached.last_checked < self.settings.content_refresh_interval_seconds:
+        if cached and self._is_fresh(cached.last_checked, time.time()):
+            metrics.repository_cache.inc("directory", "hit")
             return cached.files
 
+        metrics.repository_cache.inc("directory", "miss")
+        refreshed = await self._refresh_directory(relative_dir)
+        return refreshed.files
+
+    async def _refresh_directory(self, relative_dir: str) -> CachedDirectory:
+        """Fetch a listing into the cache, sharing one request between concurrent callers."""
+
+        async def fetch() -> CachedDirectory:
+            refreshed = await self._fetch_directory_from_github(
+                relative_dir, self._dir_cache.get(relative_dir)
+            )
+            self._dir_cache[relative_dir] = refreshed
+            return refreshed
+
+        return await self._flights.run(("directory", relative_dir), fetch)
+
+    async def _fetch_directory_from_github(
+        self, relative_dir: str, cached: CachedDirectory | None
+    ) -> CachedDirectory:
+        now = time.time()
         headers = {}
         if cached and cached.etag:
             headers["If-None-Match"] = cached.etag
 
         url = self._github_api_url(relative_dir)
-        response = self._client.get(url, headers=self._auth_headers(headers))
+        response = await self._github_get("directory", url, headers=self._auth_headers(headers))
         if response.status_code == httpx.codes.NOT_MODIFIED and cached:
-            cached.last_checked = now
-            return cached.files
+            return replace(cached, last_checked=now)
 
         response.raise_for_status()
         payload = response.json()
-        files = [item["name"] for item in payload if item.get("type") == "file"]
-        etag = response.headers.get("ETag")
-        self._dir_cache[relative_dir] = CachedDirectory(
-            files=files,
-            etag=etag,
+        return CachedDirectory(
+            files=[item["name"] for item in payload if item.get("type") == "file"],
+            etag=response.headers.get("ETag"),
             last_checked=now,
         )
-        return files
 
-    def _github_raw_url(self, relative_path: str) -> str:
+    async def _sync_github_archive(self, force: bool = False) -> bool:
+        """Mirror github_subdir from one tarball, but only when the branch head moved.
+
+        Returns False when the mirror was fresh enough to use without asking GitHub.
+        """
+        if not force and self._head_sha and self._is_fresh(self._head_checked, time.time()):
+            return False
+        await self._flights.run("archive", self._fetch_github_archive)
+        return True
+
+    async def _fetch_github_archive(self) -> None:
+        now = time.time()
+        headers = {"Accept": "application/vnd.github.sha"}
+        if self._head_etag:
+            headers["If-None-Match"] = self._head_etag
+        response = await self._github_get(
+            "head",
+            self._github_repo_api_url(f"commits/{self.settings.github_branch}"),
+            headers=self._auth_headers(headers),
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED and self._head_sha:
+            self._head_checked = now
+            return
+        response.raise_for_status()
+        sha = response.text.strip()
+        if sha == self._head_sha:
+            self._head_etag = response.headers.get("ETag")
+            self._head_checked = now
+            return
+
+        archive = await self._github_get(
+            "archive",
+            self._github_repo_api_url(f"tarball/{sha}"),
+            headers=self._auth_headers({}),
+            follow_redirects=True,
+        )
+        archive.raise_for_status()
+        files, directories = await asyncio.to_thread(
+            self._unpack_archive, archive.content, now
+        )
+
+        self._file_cache = files
+        self._dir_cache = directories
+        self._head_sha = sha
+        self._head_etag = response.headers.get("ETag")
+        self._head_checked = now
+
+    def _unpack_archive(
+        self, data: bytes, now: float
+    ) -> tuple[Dict[str, CachedFile], Dict[str, CachedDirectory]]:
+        subdir = self.settings.github_subdir.strip("/")
+        files: Dict[str, CachedFile] = {}
+        directories: Dict[str, CachedDirectory] = {"": CachedDirectory(files=[], last_checked=now)}
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as archive:
+            for member in archive:
+                # Archive entries are prefixed with "<owner>-<repo>-<sha>/".
+                _, _, repo_path = member.name.partition("/")
+                if subdir:
+                    if not repo_path.startswith(subdir + "/"):
+                        continue
+                    repo_path = repo_path[len(subdir) + 1:]
+                if not member.isfile() or not repo_path:
+                    continue
+                extracted = archive.extractfile(member)
+                if extracted is None:
+                    continue
+                raw = extracted.read()
+                files[repo_path] = CachedFile(
+                    content=raw.decode("utf-8", errors="replace"),
+                    etag=content_etag(raw),
+                    last_checked=now,
+                )
+                parent, _, name = repo_path.rpartition("/")
+                directories.setdefault(
+                    parent, CachedDirectory(files=[], last_checked=now)
+                ).files.append(name)
+        return files, directories
+
+    def _github_repo_api_url(self, endpoint: str) -> str:
         repo = self.settings.github_repo
         if not repo:
             raise RuntimeError("CONTENT_GITHUB_REPO must be set when using GitHub source.")
-        base = f"https://raw.githubusercontent.com/{repo}/{self.settings.github_branch}"
+        api_base = self.settings.github_api_base_url.rstrip("/")
+        return f"{api_base}/repos/{repo}/{endpoint}"
+
+    def _github_raw_url(self, relative_path: str, ref: str | None = None) -> str:
+        repo = self.settings.github_repo
+        if not repo:
+            raise RuntimeError("CONTENT_GITHUB_REPO must be set when using GitHub source.")
+        raw_base = self.settings.github_raw_base_url.rstrip("/")
+        base = f"{raw_base}/{repo}/{ref or self.settings.github_branch}"
         return "/".join([base, self.settings.github_subdir.strip("/"), relative_path])
 
     def _github_api_url(self, relative_dir: str) -> str:
         repo = self.settings.github_repo
         if not repo:
             raise RuntimeError("CONTENT_GITHUB_REPO must be set when using GitHub source.")
-        base = f"https://api.github.com/repos/{repo}/contents"
+        api_base = self.settings.github_api_base_url.rstrip("/")
+        base = f"{api_base}/repos/{repo}/contents"
         path = "/".join([self.settings.github_subdir.strip("/"), relative_dir]).rstrip("/")
         return f"{base}/{path}?ref={self.settings.github_branch}"
 
@@ -184,11 +525,6 @@ class ContentRepository:
         combined = dict(headers)
         if self.settings.github_token:
             combined["Authorization"] = f"Bearer {self.settings.github_token}"
-        combined["Accept"] = "application/vnd.github+json"
+        # Callers may ask for another media type (e.g. the bare commit SHA).
+        combined.setdefault("Accept", "application/vnd.github+json")
         return combined
-
-    def __del__(self):
-        try:
-            self._client.close()
-        except Exception:
-            pass
@@ -1,7 +1,45 @@
 """
-Shared content repository instance.
+Shared content repository and cache instances.
 """
+from ..content.bio_snapshot import BioSnapshotCache, SectionSnapshotCache, sections_for_paths
+from ..content.blog_reader import BlogReader
 from ..core.config import get_settings
+from .blog_index import BlogIndexCache
+from .content_refresher import ContentRefresher
 from .content_repository import ContentRepository
+from .content_watcher import LocalContentWatcher
+from .persistent_cache import PersistentContentCache
+from .shared_snapshot import SharedContentSnapshot
 
 content_repository = ContentRepository(settings=get_settings())
+section_snapshots = SectionSnapshotCache(content_repository)
+bio_snapshots = BioSnapshotCache(section_snapshots)
+blog_index = BlogIndexCache(
+    lambda: BlogReader.source_version(content_repository),
+    lambda: BlogReader.load_entries(content_repository),
+    lambda: content_repository.changes_pushed,
+)
+content_refresher = ContentRefresher(content_repository, get_settings())
+content_refresher.add_listener(bio_snapshots.get)
+content_refresher.add_listener(blog_index.refresh)
+content_watcher = LocalContentWatcher(content_repository, get_settings())
+content_watcher.add_invalidator(
+    lambda paths: section_snapshots.invalidate(sections_for_paths(paths))
+)
+content_watcher.add_listener(bio_snapshots.get)
+content_watcher.add_listener(blog_index.refresh)
+
+shared_content = SharedContentSnapshot(
+    get_settings(), content_repository, bio_snapshots, blog_index
+)
+content_refresher.add_listener(shared_content.publish)
+content_watcher.add_listener(shared_content.publish)
+
+content_cache = PersistentContentCache(get_settings())
+if content_cache.enabled:
+    async def save_content_cache() -> None:
+        # After the listeners above rebuilt the snapshot; the file is written off the loop.
+        await content_cache.save_in_background(content_repository, bio_snapshots)
+
+    content_refresher.add_listener(save_content_cache)
+    content_watcher.add_listener(save_content_cache)
@@ -0,0 +1,175 @@
+"""
+Filesystem watcher that pushes local content changes into the repository cache.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+
+from ..core.config import Settings
+from .content_refresher import RefreshListener
+from .content_repository import ContentRepository
+
+try:  # Optional dependency: watchfiles ships with uvicorn[standard].
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - depends on the environment
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+# watchfiles batches events for up to DEBOUNCE_MS, waiting STEP_MS for more.
+DEBOUNCE_MS = 50
+STEP_MS = 10
+# How often an idle event watcher wakes up; the first wake-up proves it is armed.
+IDLE_TIMEOUT_MS = 1000
+# How long stop() waits for the watch thread before cancelling the task.
+STOP_TIMEOUT_SECONDS = 5
+
+
+def _scan(root: Path) -> Dict[str, str]:
+    """Return {relative path: content digest} for every file under root."""
+    digests: Dict[str, str] = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = Path(directory) / name
+            try:
+                digest = hashlib.sha1(path.read_bytes()).hexdigest()
+            except OSError:
+                continue
+            digests[path.relative_to(root).as_posix()] = digest
+    return digests
+
+
+class LocalContentWatcher:
+    """Invalidates cached local files as they change, so hot reads never touch disk.
+
+    Uses inotify (through watchfiles) when available. Otherwise it polls and
+    compares content digests, which also catches edits that keep the mtime.
+    """
+
+    def __init__(self, repository: ContentRepository, settings: Settings):
+        self.repository = repository
+        self.settings = settings
+        self._listeners: List[RefreshListener] = []
+        self._invalidators: List[Callable[[List[str]], None]] = []
+        self._task: asyncio.Task | None = None
+        # Checked by the watch thread between steps; cancelling the task alone
+        # would leave that thread blocked in native code.
+        self._stop_event = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self.repository.source == "local" and self.settings.content_watch
+
+    @property
+    def root(self) -> Path:
+        return Path(self.settings.local_content_path).resolve()
+
+    def add_listener(self, listener: RefreshListener) -> None:
+        """Register a coroutine to run after every batch of changes (e.g. cache warmers)."""
+        self._listeners.append(listener)
+
+    def add_invalidator(self, invalidator: Callable[[List[str]], None]) -> None:
+        """Register a callback that drops caches derived from the changed paths."""
+        self._invalidators.append(invalidator)
+
+    def start(self) -> None:
+        """Start watching; the repository trusts its cache once the watcher is armed."""
+        if not self.enabled or self._task is not None:
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name="content-watcher")
+
+    async def stop(self) -> None:
+        """Stop watching and go back to checking files on every read."""
+        if self._task is None:
+            return
+        self._stop_event.set()
+        done, _ = await asyncio.wait({self._task}, timeout=STOP_TIMEOUT_SECONDS)
+        if not done:
+            self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.repository.watching = False
+
+    def _arm(self) -> None:
+        # Anything read before the watcher was armed may already be stale.
+        self.repository.clear_cache()
+        self.repository.watching = True
+
+    async def _apply(self, relative_paths: Iterable[str]) -> None:
+        relative_paths = list(relative_paths)
+        self.repository.invalidate_paths(relative_paths)
+        for invalidator in self._invalidators:
+            invalidator(relative_paths)
+        for listener in self._listeners:
+            try:
+                await listener()
+            except Exception:
+                logger.exception("Content watcher listener failed")
+
+    async def _run(self) -> None:
+        try:
+            if awatch is not None:
+                try:
+                    await self._watch_events()
+                    return
+                except Exception:
+                    if self._stop_event.is_set():
+                        return
+                    logger.warning(
+                        "Filesystem events unavailable for %s; polling instead",
+                        self.root,
+                        exc_info=True,
+                    )
+                    self.repository.watching = False
+            await self._poll()
+        except Exception:
+            logger.exception("Content watcher stopped; files are checked on every read")
+        finally:
+            self.repository.watching = False
+
+    async def _watch_events(self) -> None:
+        root = self.root
+        async for changes in awatch(
+            root,
+            debounce=DEBOUNCE_MS,
+            step=STEP_MS,
+            stop_event=self._stop_event,
+            rust_timeout=IDLE_TIMEOUT_MS,
+            yield_on_timeout=True,
+        ):
+            if not self.repository.watching:
+                self._arm()
+            if not changes:
+                continue
+            paths = []
+            for _, path in changes:
+                try:
+                    paths.append(Path(path).relative_to(root).as_posix())
+                except ValueError:
+                    continue
+            await self._apply(paths)
+
+    async def _poll(self) -> None:
+        root = self.root
+        interval = max(self.settings.content_watch_poll_interval_seconds, 0.1)
+        digests = await asyncio.to_thread(_scan, root)
+        self._arm()
+        while not await asyncio.to_thread(self._stop_event.wait, interval):
+            current = await asyncio.to_thread(_scan, root)
+            changed = [
+                path for path in digests.keys() | current.keys()
+                if digests.get(path) != current.get(path)
+            ]
+            digests = current
+            if changed:
+                await self._apply(changed)
@@ -0,0 +1,57 @@
+"""
+GitHub push webhook verification and changed-path extraction.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet
+import hashlib
+import hmac
+
+from ..core.config import Settings
+
+SIGNATURE_PREFIX = "sha256="
+# Push webhook payloads list at most 2048 commits; a full list may be truncated.
+MAX_PUSH_COMMITS = 2048
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """Check an X-Hub-Signature-256 header against the raw request body."""
+    if not signature or not signature.startswith(SIGNATURE_PREFIX):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len(SIGNATURE_PREFIX):])
+
+
+@dataclass(frozen=True)
+class PushChanges:
+    """Content paths touched by a push, relative to github_subdir."""
+
+    head: str | None
+    paths: FrozenSet[str]
+    # False when the payload cannot list every changed file (truncated or forced).
+    complete: bool
+
+
+def parse_push(payload: Dict[str, Any], settings: Settings) -> PushChanges | None:
+    """Extract the content changes of a push, or None if it does not affect content."""
+    repository = (payload.get("repository") or {}).get("full_name") or ""
+    if settings.github_repo and repository.lower() != settings.github_repo.lower():
+        return None
+    if payload.get("ref") != f"refs/heads/{settings.github_branch}" or payload.get("deleted"):
+        return None
+
+    subdir = settings.github_subdir.strip("/")
+    prefix = f"{subdir}/" if subdir else ""
+    commits = payload.get("commits") or []
+    paths = set()
+    for commit in commits:
+        for key in ("added", "modified", "removed"):
+            for path in commit.get(key) or []:
+                if path.startswith(prefix):
+                    paths.add(path[len(prefix):])
+
+    complete = not payload.get("forced") and len(commits) < MAX_PUSH_COMMITS
+    if complete and not paths:
+        return None
+    return PushChanges(head=payload.get("after"), paths=frozenset(paths), complete=complete)
@@ -0,0 +1,95 @@
+"""
+Pre-serialized JSON payloads and conditional-request helpers.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict
+import asyncio
+import hashlib
+
+import pydantic_core
+from fastapi import Request, Response
+
+from ..core.config import get_settings
+from . import metrics
+from .compression import FAST_COMPRESSORS, encoded_etag, negotiate_encoding
+from .single_flight import SingleFlight
+
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# Larger bodies are compressed in a worker thread instead of on the event loop.
+INLINE_COMPRESS_MAX_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class SerializedPayload:
+    """JSON response body encoded once, with a strong ETag over its bytes."""
+
+    # A memoryview when the body lives in a shared snapshot mapping.
+    body: bytes | memoryview
+    etag: str
+    # Compressed bodies, filled in on first use and reused for the payload's lifetime.
+    _encodings: Dict[str, bytes] = field(default_factory=dict, compare=False, repr=False)
+    _flights: SingleFlight = field(default_factory=SingleFlight, compare=False, repr=False)
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> "SerializedPayload":
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        return cls(body=body, etag=f'"{digest}"')
+
+    @classmethod
+    def from_object(cls, value: Any) -> "SerializedPayload":
+        """Encode Pydantic models, dicts and lists to JSON bytes."""
+        with metrics.stage_seconds.time("serialize"):
+            return cls.from_bytes(pydantic_core.to_json(value))
+
+    async def encoded(self, coding: str) -> bytes:
+        """Return the body compressed with ``coding``, compressing it at most once.
+
+        Every content version and projection is compressed on first request,
+        so this uses the fast levels rather than the maximum ones.
+        """
+        body = self._encodings.get(coding)
+        if body is None:
+            compress = FAST_COMPRESSORS[coding]
+            if len(self.body) <= INLINE_COMPRESS_MAX_BYTES:
+                body = compress(self.body)
+            else:
+                body = await self._flights.run(
+                    coding, lambda: asyncio.to_thread(compress, self.body)
+                )
+            self._encodings[coding] = body
+        return body
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def payload_response(request: Request, payload: SerializedPayload) -> Response:
+    """Return the payload in the best accepted encoding, or 304 if the client has it."""
+    compressible = len(payload.body) >= get_settings().api_compression_min_bytes
+    coding = negotiate_encoding(
+        request.headers.get("accept-encoding"), FAST_COMPRESSORS if compressible else ()
+    )
+    etag = encoded_etag(payload.etag, coding)
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if compressible:
+        headers["Vary"] = "Accept-Encoding"
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+        return Response(
+            content=await payload.encoded(coding), media_type="application/json", headers=headers
+        )
+    return Response(
+        content=payload.body, media_type="application/json", headers=headers
+    )
@@ -0,0 +1,125 @@
+"""
+SPA shells with pre-rendered markup and the current content inlined.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from html import escape
+from typing import Dict, Hashable, Tuple
+import asyncio
+import re
+
+from ..content.bio_snapshot import BioSnapshot
+from .blog_index import BlogIndex
+from .compression import FAST_COMPRESSORS
+from .http_cache import SerializedPayload
+from .prerender import PageMarkup
+from .single_flight import SingleFlight
+from .static_assets import StaticAsset
+
+BOOTSTRAP_GLOBAL = "__BIO_BOOTSTRAP__"
+
+# Content sections each route renders (None: all of them). Other routes inline
+# no content and the app fetches /api/content/ once it has mounted.
+ROUTE_SECTIONS: Dict[str, Tuple[str, ...] | None] = {
+    "": None,
+    "about": ("bio",),
+    "experience": ("experience",),
+    "talks": ("talks",),
+    "publications": ("publications",),
+}
+
+_TITLE_PATTERN = re.compile(rb"<title>.*?</title>", re.DOTALL)
+_ROOT_ELEMENT = b'<div id="root"></div>'
+
+
+@dataclass(frozen=True)
+class Bootstrap:
+    """Data inlined into a page: the first page of /api/blog/ and what the route shows of /api/content/."""
+
+    blog: SerializedPayload
+    content: SerializedPayload | None = None
+    # The content holds only some sections; the app loads the rest in the background.
+    partial: bool = False
+
+    @classmethod
+    def for_route(cls, route: str, snapshot: BioSnapshot, blog: BlogIndex) -> "Bootstrap":
+        blog_payload = blog.first_page_payload()
+        if route not in ROUTE_SECTIONS:
+            return cls(blog=blog_payload)
+        sections = ROUTE_SECTIONS[route]
+        return cls(
+            blog=blog_payload,
+            content=snapshot.payload(sections),
+            partial=sections is not None,
+        )
+
+    @property
+    def key(self) -> Hashable:
+        return (self.content.etag if self.content else None, self.blog.etag, self.partial)
+
+
+def bootstrap_script(bootstrap: Bootstrap) -> bytes:
+    payload = b'{"blog":' + bootstrap.blog.body
+    if bootstrap.content is not None:
+        payload += b',"content":' + bootstrap.content.body
+    if bootstrap.partial:
+        payload += b',"partial":true'
+    # "<" is escaped so the JSON can never close the inline <script> early.
+    payload = (payload + b"}").replace(b"<", b"\\u003c")
+    return b"<script>window." + BOOTSTRAP_GLOBAL.encode() + b"=" + payload + b";</script>"
+
+
+def _assemble(
+    template: StaticAsset, bootstrap: Bootstrap | None, markup: PageMarkup | None
+) -> StaticAsset:
+    html = template.body
+    if markup is not None:
+        title = b"<title>" + escape(markup.title, quote=False).encode("utf-8") + b"</title>"
+        html = _TITLE_PATTERN.sub(lambda _: title, html, count=1)
+        html = html.replace(
+            _ROOT_ELEMENT, b'<div id="root">' + markup.html + b"</div>", 1
+        )
+    if bootstrap is not None:
+        script = bootstrap_script(bootstrap)
+        marker = html.find(b"</head>")
+        html = html[:marker] + script + html[marker:] if marker != -1 else script + html
+    # Pages are rebuilt whenever their content changes, so use the fast levels.
+    return StaticAsset.from_bytes("index.html", html, FAST_COMPRESSORS)
+
+
+class PageRenderer:
+    """Assembles one page per route, re-rendering it only when its inputs change.
+
+    Pages carry large inlined payloads, so they are assembled and compressed in
+    a worker thread; concurrent requests for the same page share that work.
+    """
+
+    def __init__(self) -> None:
+        self._pages: Dict[str, Tuple[Hashable, StaticAsset]] = {}
+        self._flights = SingleFlight()
+
+    async def render(
+        self,
+        route: str,
+        template: StaticAsset,
+        bootstrap: Bootstrap | None = None,
+        markup: PageMarkup | None = None,
+    ) -> StaticAsset:
+        key = (
+            template.etag,
+            bootstrap.key if bootstrap else None,
+            markup.key if markup else None,
+        )
+        cached = self._pages.get(route)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        page = await self._flights.run(
+            (route, key), lambda: asyncio.to_thread(_assemble, template, bootstrap, markup)
+        )
+        self._pages[route] = (key, page)
+        return page
+
+    def discard(self, route: str) -> None:
+        self._pages.pop(route, None)
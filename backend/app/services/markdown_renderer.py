@@ -1,14 +1,22 @@
 """
 Utility helpers for rendering markdown to sanitized HTML.
 """
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Iterable
+from threading import Lock, local
+from typing import Dict, Iterable
+import hashlib
+import html as html_lib
+import re
 
 import bleach
 from markdown_it import MarkdownIt
 from mdit_py_plugins.footnote import footnote_plugin
 from mdit_py_plugins.tasklists import tasklists_plugin
 
+from ..core.config import get_settings
+from . import metrics
+
 
 def _build_renderer() -> MarkdownIt:
     return (
@@ -65,14 +73,141 @@ ALLOWED_ATTRIBUTES = {
 
 ALLOWED_PROTOCOLS = tuple(bleach.sanitizer.ALLOWED_PROTOCOLS) + ("mailto",)
 
+_thread_state = local()
+
+
+def _sanitizer() -> bleach.sanitizer.Cleaner:
+    """Return this thread's Cleaner (Cleaner instances are not thread-safe)."""
+    cleaner = getattr(_thread_state, "cleaner", None)
+    if cleaner is None:
+        cleaner = bleach.sanitizer.Cleaner(
+            tags=ALLOWED_TAGS,
+            attributes=ALLOWED_ATTRIBUTES,
+            protocols=ALLOWED_PROTOCOLS,
+        )
+        _thread_state.cleaner = cleaner
+    return cleaner
+
+
+# Renderer output tags look exactly like this; anything else (self-closing
+# void tags, unquoted attributes, ...) is left to bleach.
+_TAG_PATTERN = re.compile(r'<(/?)([a-z][a-z0-9]*)((?: [a-z][a-z0-9-]*="[^"<>]*")*)>')
+_ATTRIBUTE_PATTERN = re.compile(r' ([a-z][a-z0-9-]*)="([^"]*)"')
+_SCHEME_PATTERN = re.compile(r"^([a-z][a-z0-9+.-]*):", re.IGNORECASE)
+_ALLOWED_TAG_SET = frozenset(ALLOWED_TAGS)
+_ALLOWED_PROTOCOL_SET = frozenset(ALLOWED_PROTOCOLS)
+
+
+def _is_allowed_uri(value: str) -> bool:
+    if "&" in value.replace("&amp;", "") or any(ch.isspace() for ch in value):
+        return False
+    scheme = _SCHEME_PATTERN.match(html_lib.unescape(value))
+    return scheme is None or scheme.group(1).lower() in _ALLOWED_PROTOCOL_SET
+
+
+def _needs_sanitizing(html: str) -> bool:
+    """Return False only when bleach would return the renderer output unchanged.
+
+    With ``html`` disabled, markdown-it escapes every ``<`` in the source, so
+    each ``<`` left in its output starts a tag the renderer produced itself.
+    """
+    tag_count = 0
+    for match in _TAG_PATTERN.finditer(html):
+        tag_count += 1
+        closing, tag, attributes = match.groups()
+        if tag not in _ALLOWED_TAG_SET or (closing and attributes):
+            return True
+        allowed = ALLOWED_ATTRIBUTES.get(tag, ())
+        for name, value in _ATTRIBUTE_PATTERN.findall(attributes):
+            if name not in allowed:
+                return True
+            if name in ("href", "src") and not _is_allowed_uri(value):
+                return True
+    return tag_count != html.count("<")
+
+
+class RenderCache:
+    """Content-addressed LRU cache of rendered, sanitized HTML with a byte budget."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def key(markdown_text: str) -> str:
+        return hashlib.sha256(markdown_text.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def put(self, key: str, html: str) -> None:
+        entry_size = len(key) + len(html)
+        if entry_size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(key) + len(previous)
+            self._entries[key] = html
+            self._size += entry_size
+            while self._size > self.max_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted_key) + len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def export(self) -> Dict[str, str]:
+        """Return cached fragments, least recently used first."""
+        with self._lock:
+            return dict(self._entries)
+
+    def load(self, entries: Dict[str, str]) -> None:
+        for key, html in entries.items():
+            self.put(key, html)
+
+
+render_cache = RenderCache(get_settings().markdown_render_cache_max_bytes)
+
+
+def _render_uncached(markdown_text: str) -> str:
+    renderer = _renderer()
+    with metrics.stage_seconds.time("render_markdown"):
+        html = renderer.render(markdown_text)
+    with metrics.stage_seconds.time("sanitize"):
+        if not renderer.options["html"] and not _needs_sanitizing(html):
+            return html
+        return _sanitizer().clean(html)
+
 
 def render_markdown(markdown_text: str) -> str:
-    """Render markdown text into sanitized HTML."""
-    html = _renderer().render(markdown_text)
-    cleaned = bleach.clean(
-        html,
-        tags=ALLOWED_TAGS,
-        attributes=ALLOWED_ATTRIBUTES,
-        protocols=ALLOWED_PROTOCOLS,
-    )
-    return cleaned
+    """Render markdown text into sanitized HTML, reusing identical earlier renders."""
+    key = RenderCache.key(markdown_text)
+    html = render_cache.get(key)
+    if html is None:
+        html = _render_uncached(markdown_text)
+        render_cache.put(key, html)
+    return html
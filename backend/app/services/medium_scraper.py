@@ -4,7 +4,7 @@ Extracts metadata and content from Medium URLs.
 """
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 from urllib.parse import urlparse
 
 from ..models.blog import BlogPost
@@ -21,6 +21,12 @@ class MediumScraper:
         # Medium URLs typically end with the article ID
         return path_parts[-1] if path_parts else ""
 
+    @staticmethod
+    def slugify(title: str) -> str:
+        """Generate a URL-friendly slug from a post title."""
+        slug = re.sub(r'[^\w\s-]', '', title.lower())
+        return re.sub(r'[\s_-]+', '-', slug).strip('-')
+
     @staticmethod
     def create_blog_post_from_medium_data(medium_data: Dict[str, Any]) -> BlogPost:
         """Create a BlogPost from scraped Medium data."""
@@ -84,8 +90,7 @@ class MediumScraper:
         medium_url = metadata.get('og:url') or metadata.get('al:web:url', '')
 
         # Generate slug from title
-        slug = re.sub(r'[^\w\s-]', '', title.lower())
-        slug = re.sub(r'[\s_-]+', '-', slug).strip('-')
+        slug = MediumScraper.slugify(title)
 
         # Generate ID from URL
         article_id = MediumScraper.extract_article_id(medium_url)
@@ -103,62 +108,3 @@ class MediumScraper:
             featured=False,
             published=True
         )
-
-    @staticmethod
-    def get_medium_posts() -> list[BlogPost]:
-        """Get predefined Medium blog posts."""
-        # These are the two articles provided by the user
-        medium_urls = [
-            "https://medium.com/loblaw-digital/unlocking-experimentation-with-helios-recommendation-engine-ff91d697b943",
-            "https://medium.com/loblaw-digital/enriching-the-online-shopping-experience-with-helios-recommendation-engine-dc85d80ca688"
-        ]
-
-        posts = []
-        for url in medium_urls:
-            # In a real implementation, you'd scrape each URL here
-            # For now, we'll use the data we already scraped
-            if "unlocking-experimentation" in url:
-                # Data from first article
-                medium_data = {
-                    "metadata": {
-                        "og:title": "Unlocking Experimentation with Helios Recommendation Engine",
-                        "author": "Samara Xiang",
-                        "og:description": "Co-authored by: Samara Xiang, Yuhan Qin, Mefta Sadat, JC Seok, Alex Yip",
-                        "article:published_time": "2024-10-22T19:08:15Z",
-                        "og:image": "https://miro.medium.com/v2/resize:fit:1200/1*m_8gxkI8M7xoVDmdwifKhw.png",
-                        "og:url": url
-                    },
-                    "jsonld": {
-                        "headline": "Unlocking Experimentation with Helios Recommendation Engine",
-                        "author": {"name": "Samara Xiang"},
-                        "datePublished": "2024-10-22T19:08:15Z",
-                        "description": "Co-authored by: Samara Xiang, Yuhan Qin, Mefta Sadat, JC Seok, Alex Yip"
-                    }
-                }
-            elif "enriching-the-online-shopping" in url:
-                # Data from second article
-                medium_data = {
-                    "metadata": {
-                        "og:title": "Enriching the online shopping experience with Helios Recommendation Engine",
-                        "author": "Alex Yip",
-                        "og:description": "Co-authored by: JC Seok, Mefta Sadat, Alex Yip, Indrani Gorti, Julia Lee",
-                        "article:published_time": "2023-06-26T17:01:57Z",
-                        "og:image": "https://miro.medium.com/v2/resize:fit:1200/1*tEMfO2p9c_fJBJfa2TJDXg.png",
-                        "og:url": url
-                    },
-                    "jsonld": {
-                        "headline": "Enriching the online shopping experience with Helios Recommendation Engine",
-                        "author": {"name": "Alex Yip"},
-                        "datePublished": "2023-06-26T17:01:57Z",
-                        "description": "Co-authored by: JC Seok, Mefta Sadat, Alex Yip, Indrani Gorti, Julia Lee"
-                    }
-                }
-            else:
-                continue
-
-            post = MediumScraper.create_blog_post_from_medium_data(medium_data)
-            posts.append(post)
-
-        # Sort by published date (newest first)
-        posts.sort(key=lambda x: x.published_at, reverse=True)
-        return posts
@@ -0,0 +1,170 @@
+"""
+Process-local counters and stage timings, exposed in Prometheus text format.
+"""
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from ..core.config import get_settings
+
+Labels = Tuple[str, ...]
+# (metric name, type, help, [(label values, value)]) produced at scrape time.
+Collected = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Labels, values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with a fixed set of labels; increments are plain dict updates."""
+
+    def __init__(self, name: str, help_text: str, labels: Labels = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def total(self) -> float:
+        """Sum over every label combination."""
+        return sum(self._values.values())
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {value:g}")
+        return lines
+
+
+class _Timing:
+    __slots__ = ("summary", "label_values", "start")
+
+    def __init__(self, summary: "Summary", label_values: Labels):
+        self.summary = summary
+        self.label_values = label_values
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.summary.observe(perf_counter() - self.start, *self.label_values)
+
+
+class _NoTiming:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NO_TIMING = _NoTiming()
+
+
+class Summary:
+    """Count and total of observed durations, without quantiles (cheap to update)."""
+
+    def __init__(self, name: str, help_text: str, labels: Labels = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: Dict[Labels, List[float]] = {}
+
+    def observe(self, seconds: float, *label_values: str) -> None:
+        totals = self._values.get(label_values)
+        if totals is None:
+            totals = self._values[label_values] = [0, 0.0]
+        totals[0] += 1
+        totals[1] += seconds
+
+    def time(self, *label_values: str) -> _Timing | _NoTiming:
+        """Time a block: ``with summary.time("stage"): ...``."""
+        if not registry.enabled:
+            return _NO_TIMING
+        return _Timing(self, label_values)
+
+    def totals(self, *label_values: str) -> Tuple[int, float]:
+        count, total = self._values.get(label_values, (0, 0.0))
+        return count, total
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} summary"]
+        for label_values, (count, total) in sorted(self._values.items()):
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_count{labels} {count}")
+            lines.append(f"{self.name}_sum{labels} {total:.9f}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds every metric of the process and renders the /metrics page."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: List[Counter | Summary] = []
+        self._collectors: List[Callable[[], Iterable[Collected]]] = []
+
+    def counter(self, name: str, help_text: str, labels: Labels = ()) -> Counter:
+        metric = Counter(name, help_text, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def summary(self, name: str, help_text: str, labels: Labels = ()) -> Summary:
+        metric = Summary(name, help_text, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Collected]]) -> None:
+        """Register a callback that reads values (e.g. cache sizes) only when scraped."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    label_text = _format_labels(tuple(labels), labels.values())
+                    lines.append(f"{name}{label_text} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(enabled=get_settings().metrics_enabled)
+
+github_requests = registry.counter(
+    "content_github_requests_total",
+    "GitHub requests by kind (file, directory, head, archive) and response status.",
+    ("kind", "status"),
+)
+repository_cache = registry.counter(
+    "content_repository_cache_lookups_total",
+    "Repository cache lookups by cache (file, directory) and result (hit, miss).",
+    ("cache", "result"),
+)
+stage_seconds = registry.summary(
+    "content_stage_seconds",
+    "Time spent per content pipeline stage.",
+    ("stage",),
+)
+section_load_seconds = registry.summary(
+    "content_section_load_seconds",
+    "Time spent loading one content section, including its stages.",
+    ("section",),
+)
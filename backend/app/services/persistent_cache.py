@@ -0,0 +1,151 @@
+"""
+Persistent on-disk content cache used to warm new instances.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from ..content.bio_snapshot import BioSnapshotCache
+from ..core.config import Settings
+from .content_repository import ContentRepository
+from .markdown_renderer import render_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+CACHE_FILE_NAME = "content-cache.json"
+
+
+def source_fingerprint(settings: Settings) -> str:
+    """Identify the content source so cached state is never reused for another one."""
+    source = {
+        "source": settings.content_source,
+        "local_content_path": str(settings.local_content_path),
+        "github_repo": settings.github_repo,
+        "github_branch": settings.github_branch,
+        "github_subdir": settings.github_subdir,
+        "github_sync_mode": settings.github_sync_mode,
+    }
+    encoded = json.dumps(source, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class PersistentContentCache:
+    """Saves raw files, validators, rendered fragments and serialized sections."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.directory = settings.content_cache_dir
+        self._saved_versions: Any = None
+        # Serializes background saves so an older state never replaces a newer one.
+        self._save_lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    @property
+    def path(self) -> Path:
+        return Path(self.directory) / CACHE_FILE_NAME
+
+    def fingerprint(self) -> str:
+        """Identify the content source so a cache is never reused for another one."""
+        return source_fingerprint(self.settings)
+
+    def restore(self, repository: ContentRepository, snapshots: BioSnapshotCache) -> bool:
+        """Load a valid cache file into the repository and snapshot cache."""
+        if not self.enabled:
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable content cache %s: %s", self.path, exc)
+            return False
+
+        if (
+            data.get("format") != CACHE_FORMAT_VERSION
+            or data.get("fingerprint") != self.fingerprint()
+        ):
+            logger.info("Ignoring content cache built for a different source or format")
+            return False
+
+        try:
+            repository.load_state(data["repository"])
+            if data.get("snapshot"):
+                snapshots.restore_state(data["snapshot"])
+            render_cache.load(data.get("fragments") or {})
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring invalid content cache %s: %s", self.path, exc)
+            repository.clear_cache()
+            snapshots.invalidate()
+            snapshots.sections.invalidate()
+            return False
+
+        self._saved_versions = (data.get("snapshot") or {}).get("versions")
+        return True
+
+    def save(self, repository: ContentRepository, snapshots: BioSnapshotCache) -> None:
+        """Atomically write the current cache state, if it changed since the last save."""
+        collected = self._collect(repository, snapshots)
+        if collected is not None:
+            self._write(*collected)
+
+    async def save_in_background(
+        self, repository: ContentRepository, snapshots: BioSnapshotCache
+    ) -> None:
+        """Like save(), but encode and write the file in a worker thread."""
+        async with self._save_lock:
+            collected = self._collect(repository, snapshots)
+            if collected is None:
+                return
+            try:
+                await asyncio.to_thread(self._write, *collected)
+            except OSError as exc:
+                logger.warning("Could not save content cache %s: %s", self.path, exc)
+
+    def _collect(
+        self, repository: ContentRepository, snapshots: BioSnapshotCache
+    ) -> Tuple[Dict[str, Any], Any] | None:
+        """Snapshot the state to save on the calling thread, or None if it is unchanged."""
+        if not self.enabled:
+            return None
+        snapshot_state = snapshots.export_state()
+        versions = snapshot_state["versions"] if snapshot_state else None
+        if versions is not None and versions == self._saved_versions:
+            return None
+
+        data: Dict[str, Any] = {
+            "format": CACHE_FORMAT_VERSION,
+            "fingerprint": self.fingerprint(),
+            "saved_at": time.time(),
+            "repository": repository.export_state(),
+            "snapshot": snapshot_state,
+            "fragments": render_cache.export(),
+        }
+        return data, versions
+
+    def _write(self, data: Dict[str, Any], versions: Any) -> None:
+        directory = Path(self.directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".content-cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        self._saved_versions = versions
@@ -0,0 +1,217 @@
+"""
+Static HTML markup for the SPA's routes.
+Built from the Bio snapshot and blog index; each route's markup is regenerated
+only when the source files it is built from change.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from html import escape
+from typing import Callable, Dict, Hashable, Iterable, Sequence, Tuple
+import asyncio
+
+from ..content.bio_snapshot import BioSnapshot
+from ..models.blog import BlogPost
+from ..models.portfolio import Bio
+from .blog_index import BlogIndex
+from .markdown_renderer import render_markdown
+from .single_flight import SingleFlight
+
+SITE_TITLE = "Bio Portfolio"
+HOME_BLOG_POSTS = 3
+
+
+@dataclass(frozen=True)
+class PageMarkup:
+    """Pre-rendered markup for one route and the source versions it was built from."""
+
+    key: Hashable
+    title: str
+    html: bytes
+
+
+def _text(value: str | None) -> str:
+    return escape(value or "")
+
+
+def _month(value: date | datetime) -> str:
+    return value.strftime("%b %Y")
+
+
+def _link(url: str | None, label: str, css_class: str) -> str:
+    if not url:
+        return ""
+    return (
+        f'<a href="{escape(url)}" class="{css_class}" target="_blank" '
+        f'rel="noopener noreferrer">{escape(label)}</a>'
+    )
+
+
+def _section(name: str, title: str, body: Iterable[str]) -> str:
+    return (
+        f'<section class="{name}" id="{name}"><div class="container">'
+        f'<h2 class="section-title">{escape(title)}</h2>{"".join(body)}</div></section>'
+    )
+
+
+def render_hero(bio: Bio) -> str:
+    return (
+        '<section class="hero"><div class="hero-content">'
+        f'<h1 class="hero-title">Hi, I\'m <span class="highlight">{_text(bio.name)}</span></h1>'
+        f'<h2 class="hero-subtitle">{_text(bio.title)}</h2>'
+        f'<p class="hero-description">{_text(bio.summary)}</p>'
+        '</div></section>'
+    )
+
+
+def render_about(bio: Bio) -> str:
+    return _section("about", "About Me", (
+        f'<h3 class="intro-title">{_text(bio.name)}</h3>',
+        f'<p class="intro-subtitle">{_text(bio.title)}</p>',
+        f'<div class="about-text rich-text">{render_markdown(bio.about)}</div>',
+    ))
+
+
+def render_experience(bio: Bio) -> str:
+    cards = (
+        '<div class="experience-card">'
+        f'<h3 class="experience-position">{_text(exp.position)}</h3>'
+        f'<span class="experience-company">{_text(exp.company)}</span>'
+        f'<div class="experience-date">{_month(exp.start_date)} - '
+        f'{_month(exp.end_date) if exp.end_date else "Present"}</div>'
+        f'<div class="experience-description rich-text">{exp.description_html}</div>'
+        + "".join(f'<span class="tech-tag">{_text(tech)}</span>' for tech in exp.technologies)
+        + '</div>'
+        for exp in bio.experience
+    )
+    return _section("experience", "Work Experience", cards)
+
+
+def render_talks(bio: Bio) -> str:
+    cards = (
+        '<article class="talk-card">'
+        f'<span class="talk-date">{_month(talk.date)}</span>'
+        f'<span class="talk-event">{_text(talk.event)}</span>'
+        f'<h3 class="talk-title">{_text(talk.title)}</h3>'
+        f'<div class="talk-description rich-text">{talk.description_html or ""}</div>'
+        + _link(talk.video_url, "Watch video", "talk-link")
+        + _link(talk.link, "Event page", "talk-link")
+        + '</article>'
+        for talk in bio.talks
+    )
+    return _section("talks", "Talks & Videos", cards)
+
+
+def render_publications(bio: Bio) -> str:
+    cards = (
+        '<article class="publication-card">'
+        f'<h3 class="publication-title">{_text(pub.title)}</h3>'
+        f'<span class="publication-venue">{_text(pub.venue)}</span> '
+        f'<span class="publication-date">{_month(pub.date)}</span>'
+        f'<p class="publication-authors">{_text(", ".join(pub.authors))}</p>'
+        f'<div class="publication-summary rich-text">{pub.summary_html or ""}</div>'
+        + _link(pub.url, "Read paper", "publication-link")
+        + '</article>'
+        for pub in bio.publications
+    )
+    return _section("publications", "Publications", cards)
+
+
+def render_blog_list(posts: Sequence[BlogPost]) -> str:
+    cards = []
+    for post in posts:
+        href = post.medium_url or f"/blog/{post.slug}"
+        cards.append(
+            '<article class="blog-card">'
+            f'<span class="blog-date">{_month(post.published_at)}</span>'
+            f'<h3 class="blog-title"><a href="{escape(href)}">{_text(post.title)}</a></h3>'
+            f'<p class="blog-excerpt">{_text(post.excerpt)}</p>'
+            '</article>'
+        )
+    return _section("blog", "Latest Blog Posts", cards)
+
+
+def render_blog_post(post: BlogPost) -> str:
+    body = post.content_html or f'<p>{_text(post.excerpt)}</p>'
+    return (
+        '<article class="blog-post"><div class="container">'
+        f'<h1 class="blog-post-title">{_text(post.title)}</h1>'
+        f'<p class="blog-post-meta">{_text(post.author)} · {_month(post.published_at)}</p>'
+        f'<div class="blog-post-content rich-text">{body}</div>'
+        + _link(post.medium_url, "Read on Medium", "read-more")
+        + '</div></article>'
+    )
+
+
+# Section routes, the Bio source file each depends on, and their renderer.
+SECTION_PAGES: Dict[str, Tuple[str, str, Callable[[Bio], str]]] = {
+    "about": ("About", "bio.md", render_about),
+    "experience": ("Experience", "experience.md", render_experience),
+    "talks": ("Talks", "talks.md", render_talks),
+    "publications": ("Publications", "publications.md", render_publications),
+}
+
+HOME_SOURCE_FILES = ("bio.md", "experience.md", "talks.md", "publications.md")
+
+
+class PagePrerenderer:
+    """Keeps per-route markup and rebuilds a route only when its inputs change.
+
+    Markup for large sections takes a while to build, so it is built in a
+    worker thread; concurrent requests for the same route share that work.
+    """
+
+    def __init__(self) -> None:
+        self._pages: Dict[str, PageMarkup] = {}
+        self._flights = SingleFlight()
+
+    async def markup(self, route: str, snapshot: BioSnapshot, blog: BlogIndex) -> PageMarkup | None:
+        """Return the markup for a route, or None when the route has no static page."""
+        resolved = self._resolve(route, snapshot, blog)
+        if resolved is None:
+            # Drop pages of posts that have since been removed or renamed.
+            self._pages.pop(route, None)
+            return None
+
+        key, title, build = resolved
+        page = self._pages.get(route)
+        if page is None or page.key != key:
+            html = await self._flights.run(
+                (route, key), lambda: asyncio.to_thread(lambda: build().encode("utf-8"))
+            )
+            page = PageMarkup(key=key, title=title, html=html)
+            self._pages[route] = page
+        return page
+
+    @staticmethod
+    def _resolve(
+        route: str, snapshot: BioSnapshot, blog: BlogIndex
+    ) -> Tuple[Hashable, str, Callable[[], str]] | None:
+        versions = dict(snapshot.versions)
+        bio = snapshot.bio
+        if route == "":
+            key = (tuple(versions.get(path) for path in HOME_SOURCE_FILES), blog.version)
+            return key, SITE_TITLE, lambda: "".join((
+                render_hero(bio),
+                render_about(bio),
+                render_experience(bio),
+                render_blog_list(blog.posts[:HOME_BLOG_POSTS]),
+                render_talks(bio),
+                render_publications(bio),
+            ))
+        if route in SECTION_PAGES:
+            label, source, render = SECTION_PAGES[route]
+            return versions.get(source), f"{label} | {SITE_TITLE}", lambda: render(bio)
+        if route == "blog":
+            return blog.version, f"Blog | {SITE_TITLE}", lambda: render_blog_list(blog.posts)
+        if route.startswith("blog/"):
+            post = blog.by_slug.get(route[len("blog/"):])
+            if post is None:
+                return None
+            return (
+                blog.post_version(post),
+                f"{post.title} | {SITE_TITLE}",
+                lambda: render_blog_post(blog.full_post(post)),
+            )
+        return None
@@ -0,0 +1,175 @@
+"""
+Opt-in sampling profiler for live requests, producing collapsed stacks.
+
+A background thread reads ``sys._current_frames()`` at a fixed interval and
+counts the stacks of the event loop thread and the default executor threads
+(``asyncio.to_thread`` work). The output is one ``frame;frame;... count``
+line per stack, which flamegraph.pl, speedscope and inferno read directly.
+Nothing here runs unless a profiling token is configured.
+"""
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from time import perf_counter
+from types import FrameType
+from typing import Dict, Tuple
+import asyncio
+import hmac
+import secrets
+import sys
+import threading
+
+PROFILE_HEADER = b"x-profile-token"
+# Executor threads parked in these modules are idle, not doing request work.
+IDLE_MODULES = ("threading.py", "queue.py")
+
+
+def _frame_label(frame: FrameType, labels: Dict[object, str]) -> str:
+    code = frame.f_code
+    label = labels.get(code)
+    if label is None:
+        parts = code.co_filename.replace("\\", "/").rsplit("/", 2)
+        filename = "/".join(parts[-2:])
+        name = getattr(code, "co_qualname", code.co_name)
+        label = labels[code] = f"{name} ({filename}:{code.co_firstlineno})"
+    return label
+
+
+class SamplingProfiler:
+    """Samples one thread plus the asyncio executor threads until stopped."""
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None):
+        self.id = secrets.token_hex(8)
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples: Counter[Tuple[str, ...]] = Counter()
+        self.duration = 0.0
+        self._started = 0.0
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._started = perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration = perf_counter() - self._started
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                name = names.get(thread_id, "")
+                if thread_id != self.thread_id and not name.startswith("asyncio"):
+                    continue
+                if thread_id != self.thread_id and frame.f_code.co_filename.endswith(IDLE_MODULES):
+                    continue
+                self.samples[self._stack(name, frame)] += 1
+
+    def _stack(self, thread_name: str, frame: FrameType | None) -> Tuple[str, ...]:
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame, self._labels))
+            frame = frame.f_back
+        stack.append(thread_name or "thread")
+        stack.reverse()
+        return tuple(stack)
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's folded format, root frame first."""
+        lines = [
+            f"{';'.join(frame.replace(';', ':') for frame in stack)} {count}"
+            for stack, count in self.samples.most_common()
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+class ProfileStore:
+    """Runs at most one profiler at a time and keeps the latest profiles."""
+
+    def __init__(self, token: str | None, interval: float = 0.005, keep: int = 20):
+        self.token = token
+        self.interval = interval
+        self.keep = keep
+        self._active: SamplingProfiler | None = None
+        self._profiles: OrderedDict[str, SamplingProfiler] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token)
+
+    def authorized(self, token: str | None) -> bool:
+        if not self.enabled or token is None:
+            return False
+        # Bytes, because compare_digest rejects str with non-ASCII characters.
+        return hmac.compare_digest(token.encode("utf-8"), self.token.encode("utf-8"))
+
+    def begin(self) -> SamplingProfiler | None:
+        """Start sampling the calling (event loop) thread, or None if a profile is running."""
+        if self._active is not None:
+            return None
+        self._active = SamplingProfiler(self.interval)
+        self._active.start()
+        return self._active
+
+    async def end(self, profiler: SamplingProfiler) -> None:
+        try:
+            # Joining the sampler thread can take up to one interval; keep it off the loop.
+            await asyncio.to_thread(profiler.stop)
+        finally:
+            # Even if the request was cancelled meanwhile, free the slot for the next profile.
+            self._active = None
+            self._profiles[profiler.id] = profiler
+            while len(self._profiles) > self.keep:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> SamplingProfiler | None:
+        return self._profiles.get(profile_id)
+
+
+class ProfilingMiddleware:
+    """Profile requests that carry a valid ``X-Profile-Token`` header.
+
+    The response gets ``X-Profile-Id``; fetch the collapsed stacks from
+    ``/debug/profiles/{id}``. Samples cover everything the event loop ran
+    during the request, including concurrent requests.
+    """
+
+    def __init__(self, app, store: ProfileStore):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                token = value.decode("latin-1")
+                break
+        if token is None or scope["path"].startswith("/debug/") or not self.store.authorized(token):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = self.store.begin()
+        if profiler is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                headers = [*message["headers"], (b"x-profile-id", profiler.id.encode("ascii"))]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            await self.store.end(profiler)
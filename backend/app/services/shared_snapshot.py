@@ -0,0 +1,268 @@
+"""
+Content snapshot shared by the workers of one host.
+
+One worker, the holder of an flock, owns refreshes and publishes its caches as
+an immutable snapshot file. The other workers map the file and serve the
+pre-serialized payloads straight from the mapping.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+import asyncio
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+import pydantic_core
+
+from ..content.bio_snapshot import CONTENT_SECTIONS, MARKDOWN_FIELDS, BioSnapshotCache
+from ..core.config import Settings
+from ..models.blog import BlogPost
+from .blog_index import BlogIndex, BlogIndexCache
+from .content_repository import ContentRepository
+from .http_cache import SerializedPayload
+from .markdown_renderer import render_cache
+from .persistent_cache import source_fingerprint
+
+try:  # POSIX only; without flock every worker refreshes on its own.
+    import fcntl
+except ImportError:  # pragma: no cover - depends on the platform
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"BIOSNAP1"
+# Magic, generation and the length of the JSON index that follows.
+SNAPSHOT_HEADER = struct.Struct("<8sQI")
+
+# Every section projection the API serves, published pre-serialized.
+SECTION_PROJECTIONS: Tuple[Tuple[str, str], ...] = tuple(
+    (section, fields)
+    for section in CONTENT_SECTIONS
+    for fields in (("all", "html", "markdown") if section in MARKDOWN_FIELDS else ("all",))
+)
+
+
+class SharedContentSnapshot:
+    """Lets one worker refresh and render content for every worker on the host.
+
+    The snapshot file is replaced atomically, so readers always map a complete
+    generation; a mapping stays valid for as long as its payloads are in use.
+    When the leader exits, its lock is released and a follower takes over.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        repository: ContentRepository,
+        snapshots: BioSnapshotCache,
+        blog_index: BlogIndexCache,
+    ):
+        self.settings = settings
+        self.repository = repository
+        self.snapshots = snapshots
+        self.blog_index = blog_index
+        self.leader = False
+        # Generation of the snapshot last published or loaded by this worker.
+        self.generation = 0
+        self._on_leader: Callable[[], None] = lambda: None
+        self._lock_fd: int | None = None
+        self._task: asyncio.Task | None = None
+        self._published: Any = None
+        self._loaded: Tuple[int, int, int] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.shared_content_path is not None and fcntl is not None
+
+    @property
+    def path(self) -> Path:
+        return Path(self.settings.shared_content_path)
+
+    @property
+    def lock_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".lock")
+
+    def start(self, on_leader: Callable[[], None]) -> None:
+        """Join the worker group; ``on_leader`` runs once this worker owns refreshes.
+
+        Without a shared path every worker is its own leader.
+        """
+        self._on_leader = on_leader
+        if not self.enabled:
+            on_leader()
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._try_lead():
+            self.repository.follower = True
+            self._load()
+        self._task = asyncio.create_task(self._run(), name="shared-content")
+
+    async def stop(self) -> None:
+        """Stop publishing or following, releasing the leader lock."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self.leader = False
+        self.repository.follower = False
+
+    async def publish(self) -> None:
+        """Write the leader's caches to the snapshot file if the content changed."""
+        if not self.enabled or not self.leader:
+            return
+        snapshot = await self.snapshots.get()
+        sections = await asyncio.gather(
+            *(self.snapshots.sections.get(section) for section in CONTENT_SECTIONS)
+        )
+        blog = await self.blog_index.get()
+        versions = dict(snapshot.versions)
+        if any(part.version != versions[CONTENT_SECTIONS[part.section][0]] for part in sections):
+            return  # A section changed mid-publish; the next round picks it up.
+        key = (snapshot.versions, blog.version)
+        if key == self._published:
+            return
+
+        blobs: List[bytes | memoryview] = []
+        entries: Dict[str, List[Any]] = {}
+        offset = 0
+
+        def add(name: str, body: bytes | memoryview, etag: str | None = None) -> None:
+            nonlocal offset
+            entries[name] = [offset, len(body), etag]
+            blobs.append(body)
+            offset += len(body)
+
+        content = snapshot.payload()
+        add("content", content.body, content.etag)
+        by_section = {part.section: part for part in sections}
+        for section, fields in SECTION_PROJECTIONS:
+            payload = by_section[section].payload(fields)
+            add(f"{section}:{fields}", payload.body, payload.etag)
+        listing = blog.first_page_payload()
+        add("blog", listing.body, listing.etag)
+        add("blog_entries", pydantic_core.to_json(blog.entries()))
+        add("fragments", json.dumps(render_cache.export()).encode("utf-8"))
+
+        index = json.dumps({
+            "fingerprint": source_fingerprint(self.settings),
+            "repository": self.repository.export_state(),
+            "versions": [list(item) for item in snapshot.versions],
+            "blog_version": [list(item) for item in blog.version],
+            "blobs": entries,
+        }).encode("utf-8")
+        generation = time.time_ns()
+        header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, generation, len(index))
+        await asyncio.to_thread(self._write, [header, index, *blobs])
+        self._published = key
+        self.generation = generation
+
+    def _write(self, chunks: List[bytes | memoryview]) -> None:
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.writelines(chunks)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _try_lead(self) -> bool:
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        self.leader = True
+        self.repository.follower = False
+        self._on_leader()
+        return True
+
+    async def _run(self) -> None:
+        interval = max(self.settings.shared_content_poll_interval_seconds, 0.05)
+        while True:
+            try:
+                if self.leader:
+                    await self.publish()
+                elif self._try_lead():
+                    logger.info("Took over content refreshes for %s", self.path)
+                    continue
+                else:
+                    self._load()
+            except Exception:
+                logger.exception("Shared content snapshot update failed")
+            await asyncio.sleep(interval)
+
+    def _load(self) -> bool:
+        """Map the snapshot file if a new generation was published."""
+        try:
+            handle = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+        with handle:
+            stat = os.fstat(handle.fileno())
+            identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if identity == self._loaded or stat.st_size == 0:
+                return False
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        # Unreadable files are skipped until the leader replaces them.
+        self._loaded = identity
+        try:
+            self._install(memoryview(mapping))
+        except (KeyError, TypeError, ValueError, struct.error) as exc:
+            logger.warning("Ignoring invalid shared content snapshot %s: %s", self.path, exc)
+            return False
+        return True
+
+    def _install(self, view: memoryview) -> None:
+        magic, generation, index_length = SNAPSHOT_HEADER.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("not a content snapshot")
+        start = SNAPSHOT_HEADER.size
+        index = json.loads(bytes(view[start:start + index_length]))
+        if index["fingerprint"] != source_fingerprint(self.settings):
+            raise ValueError("snapshot was built for a different content source")
+        data = view[start + index_length:]
+
+        def payload(name: str) -> SerializedPayload:
+            offset, length, etag = index["blobs"][name]
+            return SerializedPayload(body=data[offset:offset + length], etag=etag)
+
+        # Decode everything first, then swap it in without yielding to requests.
+        sections = {
+            (section, fields): payload(f"{section}:{fields}")
+            for section, fields in SECTION_PROJECTIONS
+        }
+        blog = BlogIndex.build(
+            [
+                (BlogPost.model_validate(post), body)
+                for post, body in json.loads(bytes(payload("blog_entries").body))
+            ],
+            version=tuple(tuple(item) for item in index["blog_version"]),
+        )
+        blog.seed_first_page(payload("blog"))
+        fragments = json.loads(bytes(payload("fragments").body))
+
+        self.snapshots.install(index["versions"], payload("content"), sections)
+        self.repository.load_state(index["repository"])
+        self.blog_index.seed(blog)
+        render_cache.load(fragments)
+        self.generation = generation
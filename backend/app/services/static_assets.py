@@ -0,0 +1,111 @@
+"""
+In-memory manifest of the compiled frontend for the SPA catch-all route.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict
+import hashlib
+import mimetypes
+
+from fastapi import Request, Response
+
+from .compression import (
+    COMPRESSIBLE_TYPES,
+    COMPRESSORS,
+    Compressor,
+    encoded_etag,
+    negotiate_encoding,
+)
+from .http_cache import etag_matches
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+MIN_COMPRESS_BYTES = 256
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """A file body with its validators and precompressed variants."""
+
+    body: bytes
+    content_type: str
+    etag: str
+    cache_control: str
+    encodings: Dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        relative_path: str,
+        body: bytes,
+        compressors: Dict[str, Compressor] = COMPRESSORS,
+    ) -> "StaticAsset":
+        content_type = mimetypes.guess_type(relative_path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+        encodings: Dict[str, bytes] = {}
+        if len(body) >= MIN_COMPRESS_BYTES and content_type.startswith(COMPRESSIBLE_TYPES):
+            for coding, compress in compressors.items():
+                compressed = compress(body)
+                if len(compressed) < len(body):
+                    encodings[coding] = compressed
+        # Vite fingerprints everything under assets/, so those never change in place.
+        cache_control = (
+            IMMUTABLE_CACHE_CONTROL
+            if relative_path.startswith("assets/")
+            else REVALIDATE_CACHE_CONTROL
+        )
+        return cls(
+            body=body,
+            content_type=content_type,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            cache_control=cache_control,
+            encodings=encodings,
+        )
+
+    def response(self, request: Request) -> Response:
+        """Serve the best representation for the request, or 304 if unchanged."""
+        coding = negotiate_encoding(request.headers.get("accept-encoding"), self.encodings)
+        etag = encoded_etag(self.etag, coding)
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        if self.encodings:
+            headers["Vary"] = "Accept-Encoding"
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        if coding is not None:
+            headers["Content-Encoding"] = coding
+            return Response(self.encodings[coding], media_type=self.content_type, headers=headers)
+        return Response(self.body, media_type=self.content_type, headers=headers)
+
+
+class StaticAssetManifest:
+    """Maps URL paths under the frontend build to preloaded StaticAssets."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._assets: Dict[str, StaticAsset] | None = None
+
+    def build(self) -> None:
+        """Load every file under the build directory into memory."""
+        assets: Dict[str, StaticAsset] = {}
+        if self.root.is_dir():
+            for path in self.root.rglob("*"):
+                if path.is_file():
+                    relative_path = path.relative_to(self.root).as_posix()
+                    assets[relative_path] = StaticAsset.from_bytes(relative_path, path.read_bytes())
+        self._assets = assets
+
+    @property
+    def assets(self) -> Dict[str, StaticAsset]:
+        if self._assets is None:
+            self.build()
+        return self._assets
+
+    def get(self, relative_path: str) -> StaticAsset | None:
+        return self.assets.get(relative_path)
+
+    @property
+    def index(self) -> StaticAsset | None:
+        return self.assets.get("index.html")
@@ -0,0 +1,5 @@
+"""
+Benchmarks for the content, blog and frontend-serving hot paths.
+
+Run ``python -m benchmarks.run --help`` from the backend directory.
+"""
@@ -0,0 +1,156 @@
+"""
+Deterministic synthetic content corpora in the markdown layout the app reads.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict
+import random
+
+import yaml
+
+# Number of experiences, talks, publications and blog posts per scale.
+SCALES: Dict[str, int] = {
+    "tiny": 10,
+    "small": 100,
+    "medium": 1_000,
+    "large": 10_000,
+}
+
+TAGS = ("mlops", "python", "gcp", "kubernetes", "llm", "data", "search", "recsys")
+WORDS = (
+    "pipeline model feature platform latency cache schema batch stream deploy "
+    "experiment metric serving training cluster ranking embedding vector index "
+    "query workflow monitor rollout service budget throughput"
+).split()
+
+_EPOCH = date(2015, 1, 1)
+
+
+def _sentence(rng: random.Random, index: int) -> str:
+    words = rng.sample(WORDS, 9)
+    words[2] = f"**{words[2]}**"
+    words[5] = f"[{words[5]}](https://example.com/{index}/{words[5]})"
+    return " ".join(words).capitalize() + f" ({index})."
+
+
+def _markdown(rng: random.Random, index: int, paragraphs: int) -> str:
+    """Markdown with the constructs the renderer handles: emphasis, links, lists, code."""
+    blocks = [" ".join(_sentence(rng, index) for _ in range(3)) for _ in range(paragraphs)]
+    blocks.append("\n".join(f"- `{word}` item {index}" for word in rng.sample(WORDS, 3)))
+    return "\n\n".join(blocks)
+
+
+def _frontmatter(data: Dict, body: str = "") -> str:
+    header = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+    return f"---\n{header}---\n\n{body}\n"
+
+
+def generate(root: Path, count: int, seed: int = 0) -> Dict[str, int]:
+    """Write a corpus of ``count`` items per section under ``root``; return its stats."""
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    blog_dir = root / "blog"
+    blog_dir.mkdir(exist_ok=True)
+
+    (root / "bio.md").write_text(
+        _frontmatter(
+            {"name": "Bench Person", "title": "Engineer", "summary": _sentence(rng, 0)},
+            _markdown(rng, 0, 4),
+        ),
+        encoding="utf-8",
+    )
+    (root / "education.md").write_text(
+        _frontmatter({
+            "education": [
+                {
+                    "id": f"edu-{index}",
+                    "institution": f"University {index}",
+                    "degree": "Master of Science",
+                    "field_of_study": "Computer Science",
+                    "start_date": _EPOCH + timedelta(days=index),
+                    "end_date": _EPOCH + timedelta(days=index + 700),
+                }
+                for index in range(min(count, 10))
+            ]
+        }),
+        encoding="utf-8",
+    )
+    (root / "experience.md").write_text(
+        _frontmatter({
+            "experiences": [
+                {
+                    "id": f"exp-{index}",
+                    "company": f"Company {index}",
+                    "position": "Staff Engineer",
+                    "start_date": _EPOCH + timedelta(days=index),
+                    "end_date": None if index == 0 else _EPOCH + timedelta(days=index + 365),
+                    "description": _markdown(rng, index, 2),
+                    "technologies": rng.sample(TAGS, 3),
+                }
+                for index in range(count)
+            ]
+        }),
+        encoding="utf-8",
+    )
+    (root / "talks.md").write_text(
+        _frontmatter({
+            "talks": [
+                {
+                    "id": f"talk-{index}",
+                    "title": f"Talk {index}",
+                    "event": f"Conference {index % 50}",
+                    "date": _EPOCH + timedelta(days=index),
+                    "location": "Virtual",
+                    "link": f"https://example.com/talks/{index}",
+                    "description": _markdown(rng, index, 1),
+                }
+                for index in range(count)
+            ]
+        }),
+        encoding="utf-8",
+    )
+    (root / "publications.md").write_text(
+        _frontmatter({
+            "publications": [
+                {
+                    "id": f"pub-{index}",
+                    "title": f"Publication {index}",
+                    "venue": f"Journal {index % 20}",
+                    "date": _EPOCH + timedelta(days=index),
+                    "authors": ["Bench Person", f"Coauthor {index}"],
+                    "url": f"https://example.com/papers/{index}",
+                    "summary": _markdown(rng, index, 1),
+                }
+                for index in range(count)
+            ]
+        }),
+        encoding="utf-8",
+    )
+
+    published = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    for index in range(count):
+        (blog_dir / f"post-{index:05d}.md").write_text(
+            _frontmatter(
+                {
+                    "id": f"post-{index}",
+                    "title": f"Post {index}",
+                    "slug": f"post-{index}",
+                    "excerpt": _sentence(rng, index),
+                    "author": "Bench Person",
+                    "published_at": (published + timedelta(hours=index)).isoformat(),
+                    "tags": rng.sample(TAGS, 2),
+                    "featured": index % 10 == 0,
+                },
+                _markdown(rng, index, 6),
+            ),
+            encoding="utf-8",
+        )
+
+    files = [path for path in root.rglob("*.md")]
+    return {
+        "items_per_section": count,
+        "files": len(files),
+        "bytes": sum(path.stat().st_size for path in files),
+    }
@@ -0,0 +1,129 @@
+"""
+Local stand-in for the GitHub endpoints the content repository calls.
+
+Serves a corpus directory as raw files, contents API listings, a branch head
+SHA and a tarball, with ETags and 304s like GitHub, and counts requests.
+"""
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import hashlib
+import io
+import json
+import tarfile
+import threading
+
+REPO = "bench/content"
+BRANCH = "main"
+SUBDIR = "content"
+
+
+class GitHubStub:
+    """Threaded HTTP server on an ephemeral port; use as a context manager."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict:
+        """Settings that point the app at this stub."""
+        return {
+            "CONTENT_SOURCE": "github",
+            "CONTENT_GITHUB_REPO": REPO,
+            "CONTENT_GITHUB_BRANCH": BRANCH,
+            "CONTENT_GITHUB_SUBDIR": SUBDIR,
+            "CONTENT_GITHUB_RAW_URL": self.url,
+            "CONTENT_GITHUB_API_URL": self.url,
+        }
+
+    def __enter__(self) -> "GitHubStub":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _head_sha(self) -> str:
+        digest = hashlib.sha1()
+        for path in sorted(self.root.rglob("*")):
+            if path.is_file():
+                digest.update(path.relative_to(self.root).as_posix().encode("utf-8"))
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _tarball(self) -> bytes:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for path in sorted(self.root.rglob("*")):
+                if path.is_file():
+                    relative = path.relative_to(self.root).as_posix()
+                    archive.add(path, arcname=f"bench-content-sha/{SUBDIR}/{relative}")
+        return buffer.getvalue()
+
+    def _handler(self):
+        stub = self
+        repo_prefix = ["repos", *REPO.split("/")]
+        raw_prefix = [*REPO.split("/"), BRANCH, SUBDIR]
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _send(self, status: int, body: bytes = b"", etag: str | None = None) -> None:
+                if etag and self.headers.get("If-None-Match") == etag:
+                    status, body = 304, b""
+                self.send_response(status)
+                if etag:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                stub._count()
+                parts = self.path.split("?")[0].strip("/").split("/")
+                if parts[:3] == repo_prefix and parts[3:4] == ["contents"]:
+                    directory = stub.root.joinpath(*parts[4 + len(SUBDIR.split("/")):])
+                    if not directory.is_dir():
+                        return self._send(404)
+                    body = json.dumps([
+                        {"name": entry.name, "type": "file" if entry.is_file() else "dir"}
+                        for entry in sorted(directory.iterdir())
+                    ]).encode("utf-8")
+                    return self._send(200, body, f'"{hashlib.sha1(body).hexdigest()}"')
+                if parts[:3] == repo_prefix and parts[3:4] == ["commits"]:
+                    sha = stub._head_sha()
+                    # Like GitHub, only the sha media type returns the bare SHA.
+                    if self.headers.get("Accept") == "application/vnd.github.sha":
+                        body = sha.encode("ascii")
+                    else:
+                        body = json.dumps({"sha": sha, "commit": {}}).encode("utf-8")
+                    return self._send(200, body, f'"c{hashlib.sha1(body).hexdigest()}"')
+                if parts[:3] == repo_prefix and parts[3:4] == ["tarball"]:
+                    return self._send(200, stub._tarball())
+                if parts[:len(raw_prefix)] == raw_prefix:
+                    path = stub.root.joinpath(*parts[len(raw_prefix):])
+                    if not path.is_file():
+                        return self._send(404)
+                    body = path.read_bytes()
+                    return self._send(200, body, f'"{hashlib.sha1(body).hexdigest()}"')
+                self._send(404)
+
+        return Handler
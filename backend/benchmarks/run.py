@@ -0,0 +1,232 @@
+"""
+Run the benchmark matrix and write machine-readable results.
+
+    python -m benchmarks.run --scales tiny,small --modes local,github
+    python -m benchmarks.run --output new.json --compare old.json
+
+Each (scale, mode) pair runs in fresh interpreters (one for timings, one for
+traced memory) against a generated corpus; GitHub modes go through a local
+stub server, so no network access is needed.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+from .corpus import SCALES, generate
+from .github_stub import GitHubStub
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+MODES = ("local", "github", "github-archive")
+
+# Metrics stable enough to gate on; means and tail percentiles are reported
+# but too noisy between runs to flag.
+TRACKED_SUFFIXES = (
+    "cold_ms",
+    "warm_ms",
+    "p50_ms",
+    "concurrent_rps",
+    "_us_per_doc",
+    "traced_peak_bytes",
+    "github_requests.cold",
+    "github_requests.warm",
+)
+
+# Environment shared by every run: no persistence, sharing or background work
+# that would make results depend on earlier runs or timers.
+BASE_ENV = {
+    "CONTENT_CACHE_DIR": "",
+    "SHARED_CONTENT_PATH": "",
+    "CONTENT_RELOAD_TOKEN": "",
+    "CONTENT_WEBHOOK_SECRET": "",
+    "CONTENT_BACKGROUND_REFRESH": "false",
+    "CONTENT_REFRESH_INTERVAL_SECONDS": "3600",
+}
+
+INDEX_HTML = (
+    "<!doctype html><html><head><meta charset=\"utf-8\"><title>Bench</title>"
+    "<script type=\"module\" src=\"/assets/app.js\"></script></head>"
+    "<body><div id=\"root\"></div></body></html>"
+)
+
+
+def write_frontend(root: Path) -> Path:
+    """A minimal build: index.html plus one large fingerprinted-style asset."""
+    web = root / "web"
+    (web / "assets").mkdir(parents=True, exist_ok=True)
+    (web / "index.html").write_text(INDEX_HTML, encoding="utf-8")
+    script = "".join(f"export const value{index} = {index} * 2;\n" for index in range(8000))
+    (web / "assets" / "app.js").write_text(script, encoding="utf-8")
+    return web
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(env: Dict[str, str], args: List[str]) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.scenario", *args],
+        cwd=BACKEND_DIR,
+        env={**os.environ, **env, "PYTHONPATH": str(BACKEND_DIR)},
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"benchmark scenario failed:\n{completed.stderr}")
+    return json.loads(completed.stdout)
+
+
+@contextlib.contextmanager
+def source_env(mode: str, corpus: Path) -> Iterator[Tuple[Dict[str, str], GitHubStub | None]]:
+    if mode == "local":
+        yield {"CONTENT_SOURCE": "local", "CONTENT_LOCAL_PATH": str(corpus)}, None
+        return
+    with GitHubStub(corpus) as stub:
+        sync_mode = "archive" if mode == "github-archive" else "files"
+        yield {**stub.env(), "CONTENT_GITHUB_SYNC_MODE": sync_mode}, stub
+
+
+def run_matrix(
+    scales: List[str], modes: List[str], iterations: int, concurrency: int, workdir: Path
+) -> List[Dict[str, Any]]:
+    frontend = write_frontend(workdir)
+    results = []
+    for scale in scales:
+        count = SCALES[scale]
+        corpus = workdir / f"corpus-{scale}"
+        stats = generate(corpus, count)
+        for mode in modes:
+            print(f"benchmarking {scale} ({count} items) in {mode} mode", file=sys.stderr)
+            with source_env(mode, corpus) as (env, stub):
+                env = {**BASE_ENV, **env, "BENCH_FRONTEND_DIR": str(frontend)}
+                timing = run_scenario(env, [
+                    "--phase", "timing",
+                    "--count", str(count),
+                    "--iterations", str(iterations),
+                    "--concurrency", str(concurrency),
+                ])
+                memory = run_scenario(env, ["--phase", "memory", "--count", str(count)])
+                upstream = stub.requests if stub else 0
+            results.append({
+                "scale": scale,
+                "mode": mode,
+                "corpus": stats,
+                **timing,
+                **memory,
+                "stub_requests": upstream,
+            })
+    return results
+
+
+def flatten(value: Any, prefix: str = "") -> Dict[str, float]:
+    """Map nested results to {"dotted.key": number}."""
+    if isinstance(value, dict):
+        flat: Dict[str, float] = {}
+        for key, item in value.items():
+            flat.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+        return flat
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix: float(value)}
+    return {}
+
+
+def keyed(report: Dict[str, Any]) -> Dict[str, float]:
+    flat: Dict[str, float] = {}
+    for result in report["results"]:
+        name = f"{result['scale']}/{result['mode']}"
+        for key, value in flatten(result).items():
+            flat[f"{name}/{key}"] = value
+    return flat
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[str]:
+    """Return regressions beyond ``threshold`` (0.1 = 10%), printing every change."""
+    before, after = keyed(old), keyed(new)
+    regressions = []
+    for key in sorted(before.keys() & after.keys()):
+        old_value, new_value = before[key], after[key]
+        if old_value == 0 or not key.endswith(TRACKED_SUFFIXES):
+            continue
+        change = new_value / old_value - 1
+        # Throughput is better when higher; latency, memory and request counts when lower.
+        worse = -change if key.endswith("rps") else change
+        marker = ""
+        if worse > threshold:
+            marker = "  REGRESSION"
+            regressions.append(key)
+        print(f"{key}: {old_value:.4g} -> {new_value:.4g} ({change:+.1%}){marker}")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--scales",
+        default="tiny,small,medium",
+        help=f"comma-separated scales from {', '.join(SCALES)}",
+    )
+    parser.add_argument("--modes", default="local,github", help=f"comma-separated from {', '.join(MODES)}")
+    parser.add_argument("--iterations", type=int, default=200, help="warm requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16, help="in-flight requests for throughput")
+    parser.add_argument("--output", type=Path, help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", type=Path, help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold")
+    args = parser.parse_args(argv)
+
+    scales = [scale for scale in args.scales.split(",") if scale]
+    modes = [mode for mode in args.modes.split(",") if mode]
+    unknown = set(scales) - SCALES.keys() | set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown scales or modes: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory(prefix="bio-bench-") as workdir:
+        results = run_matrix(scales, modes, args.iterations, args.concurrency, Path(workdir))
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+    encoded = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(encoded + "\n", encoding="utf-8")
+    else:
+        print(encoded)
+
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(previous, report, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+One benchmark run in a fresh interpreter, configured through the environment.
+
+The app reads its settings and builds its caches at import time, so every
+(scale, mode) pair runs in its own process. Prints one JSON object on stdout.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import tracemalloc
+
+import httpx
+
+HEADERS = {"Accept-Encoding": "gzip"}
+FRONTEND_PAGES = ("frontend_index", "frontend_route")
+BOOTSTRAP_MARKER = "window.__BIO_BOOTSTRAP__="
+EMPTY_ROOT = '<div id="root"></div>'
+
+
+def endpoints(count: int) -> Dict[str, str]:
+    """Hot-path URLs, in the order a cold process first hits them."""
+    newest = f"post-{count - 1}"
+    return {
+        "content": "/api/content/",
+        "content_include": "/api/content/?include=talks,publications&fields=html",
+        "section_talks": "/api/content/talks",
+        "blog_list": "/api/blog/?limit=10",
+        "blog_tag": "/api/blog/?tag=mlops&limit=10",
+        "blog_post": f"/api/blog/slug/{newest}",
+        "frontend_index": "/",
+        "frontend_route": f"/blog/{newest}",
+        "static_asset": "/assets/app.js",
+    }
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    return {
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "rps": len(ordered) / sum(ordered) if sum(ordered) else 0.0,
+    }
+
+
+async def timed(call: Callable[[], Awaitable[Any]]) -> float:
+    start = perf_counter()
+    await call()
+    return perf_counter() - start
+
+
+async def fetch(client: httpx.AsyncClient, url: str) -> int:
+    """GET a URL and return the body size on the wire (not decompressed client-side)."""
+    async with client.stream("GET", url, headers=HEADERS) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {response.status_code}")
+        return sum([len(chunk) async for chunk in response.aiter_raw()])
+
+
+async def check_frontend_page(client: httpx.AsyncClient, url: str) -> None:
+    """Fail the run if an HTML route lost its inlined content or pre-rendered markup."""
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    html = (await client.get(url, headers=HEADERS)).text
+    if settings.inline_initial_content and BOOTSTRAP_MARKER not in html:
+        raise RuntimeError(f"GET {url} did not inline the bootstrap payload")
+    if settings.prerender_pages and EMPTY_ROOT in html:
+        raise RuntimeError(f"GET {url} served an empty root element")
+
+
+def load_app():
+    from app import main as app_main
+    from app.services.static_assets import StaticAssetManifest
+
+    frontend = os.environ.get("BENCH_FRONTEND_DIR")
+    if frontend:
+        # Serve a synthetic build instead of app/static/web.
+        app_main.frontend_assets = StaticAssetManifest(Path(frontend))
+    return app_main.app
+
+
+async def run_direct(results: Dict[str, Any]) -> None:
+    """Time the loaders and the renderer without the HTTP stack."""
+    from app.content.markdown_reader import MarkdownReader
+    from app.core.config import get_settings
+    from app.services.content_repository import ContentRepository
+    from app.services.markdown_renderer import render_cache, render_markdown
+
+    repository = ContentRepository(get_settings())
+    render_cache.clear()
+    cold = await timed(lambda: MarkdownReader.load_bio_data(repository))
+    warm = [await timed(lambda: MarkdownReader.load_bio_data(repository)) for _ in range(3)]
+    results["load_bio_data"] = {"cold_ms": cold * 1000, "warm_ms": min(warm) * 1000}
+
+    bio = await MarkdownReader.load_bio_data(repository)
+    texts = [bio.about]
+    texts += [item.description for item in bio.experience]
+    texts += [item.description for item in bio.talks if item.description]
+    texts += [item.summary for item in bio.publications if item.summary]
+    render_cache.clear()
+    start = perf_counter()
+    for text in texts:
+        render_markdown(text)
+    cold = perf_counter() - start
+    start = perf_counter()
+    for text in texts:
+        render_markdown(text)
+    warm = perf_counter() - start
+    results["render_markdown"] = {
+        "documents": len(texts),
+        "cold_us_per_doc": cold / len(texts) * 1e6,
+        "warm_us_per_doc": warm / len(texts) * 1e6,
+    }
+    await repository.aclose()
+    render_cache.clear()
+
+
+async def run_http(results: Dict[str, Any], count: int, iterations: int, concurrency: int) -> None:
+    from app.services import metrics
+
+    app = load_app()
+    urls = endpoints(count)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            cold: Dict[str, float] = {}
+            for name, url in urls.items():
+                cold[name] = await timed(lambda: fetch(client, url))
+            for name in FRONTEND_PAGES:
+                await check_frontend_page(client, urls[name])
+            github_cold = metrics.github_requests.total()
+
+            report: Dict[str, Dict[str, float]] = {}
+            for name, url in urls.items():
+                samples = [await timed(lambda: fetch(client, url)) for _ in range(iterations)]
+                report[name] = {"cold_ms": cold[name] * 1000, **summarize(samples)}
+
+                async def worker() -> None:
+                    for _ in range(max(iterations // concurrency, 1)):
+                        await fetch(client, url)
+
+                start = perf_counter()
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+                elapsed = perf_counter() - start
+                report[name]["concurrent_rps"] = (
+                    max(iterations // concurrency, 1) * concurrency / elapsed
+                )
+    results["endpoints"] = report
+    results["github_requests"] = {
+        "cold": github_cold,
+        "warm": metrics.github_requests.total() - github_cold,
+    }
+
+
+async def run_memory(results: Dict[str, Any], count: int) -> None:
+    """Peak traced allocations while a fresh process serves every endpoint once."""
+    app = load_app()
+    transport = httpx.ASGITransport(app=app)
+    tracemalloc.start()
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for url in endpoints(count).values():
+                await fetch(client, url)
+            current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results["memory"] = {"traced_peak_bytes": peak, "traced_retained_bytes": current}
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--phase", choices=("timing", "memory"), default="timing")
+    parser.add_argument("--count", type=int, required=True)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Any] = {}
+    if args.phase == "memory":
+        asyncio.run(run_memory(results, args.count))
+    else:
+        asyncio.run(run_direct(results))
+        asyncio.run(run_http(results, args.count, args.iterations, args.concurrency))
+        # ru_maxrss is KiB on Linux and bytes on macOS.
+        scale = 1 if sys.platform == "darwin" else 1024
+        results["max_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    json.dump(results, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+The sanitizer fast path must produce exactly what bleach.clean would.
+
+render_markdown skips bleach when every tag, attribute and URL in the renderer
+output is allow-listed; these tests compare it against the full clean.
+"""
+import random
+
+import bleach
+import pytest
+
+from app.services.markdown_renderer import (
+    ALLOWED_ATTRIBUTES,
+    ALLOWED_PROTOCOLS,
+    ALLOWED_TAGS,
+    _build_renderer,
+    _needs_sanitizing,
+    _render_uncached,
+)
+
+RENDERER = _build_renderer()
+
+FRAGMENTS = [
+    "plain text",
+    "**bold** and _em_ and ~~gone~~",
+    "[link](https://example.com/a?b=1&c=2)",
+    "[mail](mailto:someone@example.com)",
+    "[js](javascript:alert(1))",
+    "[JS](JaVaScRiPt:alert(1))",
+    "[entity js](jav&#x61;script:alert(1))",
+    "[vb](vbscript:msgbox(1))",
+    "[data](data:text/html;base64,PHNjcmlwdD5hbGVydCgxKTwvc2NyaXB0Pg==)",
+    "![img](data:image/png;base64,iVBORw0KGgo=)",
+    "![img](https://example.com/x.png \"title\")",
+    "<script>alert(1)</script>",
+    "<img src=x onerror=alert(1)>",
+    "<a href=\"javascript:alert(1)\">raw</a>",
+    "&lt;b&gt; &amp; &copy; &#60;script&#62; &nbsp;",
+    "`<code>` and ```\n<pre>\n```",
+    "```python\nprint('<hi>')\n```",
+    "| a | b |\n| --- | :-: |\n| 1 | <i>2</i> |",
+    "- [ ] todo\n- [x] done",
+    "Footnote[^1]\n\n[^1]: The note.",
+    "> quote\n>\n> - item",
+    "# Heading\n\n---\n\n1. one\n2. two",
+    "autolink https://example.com/path and www.example.com",
+    "<https://example.com> <mailto:a@b.c>",
+    "line  \nbreak",
+    "\"quotes\" -- dashes ... (c)",
+]
+
+
+def reference(markdown_text: str) -> str:
+    """The previous behaviour: always run the full bleach clean."""
+    return bleach.clean(
+        RENDERER.render(markdown_text),
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        protocols=ALLOWED_PROTOCOLS,
+    )
+
+
+@pytest.mark.parametrize("markdown_text", FRAGMENTS)
+def test_fixed_cases_match_bleach(markdown_text):
+    assert _render_uncached(markdown_text) == reference(markdown_text)
+
+
+@pytest.mark.parametrize(
+    "markdown_text",
+    ["[js](javascript:alert(1))", "<script>alert(1)</script>", "<a href=\"javascript:x\">a</a>"],
+)
+def test_dangerous_markup_is_not_emitted(markdown_text):
+    html = _render_uncached(markdown_text)
+    assert "<script" not in html
+    assert 'href="javascript:' not in html.lower()
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        '<a href="javascript:alert(1)">x</a>',
+        '<a href="JAVASCRIPT:alert(1)">x</a>',
+        '<a href="jav&#x61;script:alert(1)">x</a>',
+        '<a href="java script:alert(1)">x</a>',
+        '<img src="data:image/png;base64,AAAA" alt="">',
+        '<script>alert(1)</script>',
+        '<p onclick="x()">x</p>',
+        "<br />",
+    ],
+)
+def test_unsafe_or_unusual_html_is_sanitized(html):
+    assert _needs_sanitizing(html)
+
+
+def test_plain_renderer_output_skips_bleach():
+    html = RENDERER.render("Some **text** with [a link](https://example.com).")
+    assert not _needs_sanitizing(html)
+
+
+def test_random_documents_match_bleach():
+    rng = random.Random(20240601)
+    for _ in range(2000):
+        parts = rng.choices(FRAGMENTS, k=rng.randint(1, 6))
+        separator = rng.choice(["\n\n", " ", "\n"])
+        markdown_text = separator.join(parts)
+        assert _render_uncached(markdown_text) == reference(markdown_text), markdown_text
@@ -14,14 +14,18 @@ import Talks from './components/Talks'
 import Publications from './components/Publications'
 import { API_BASE_URL } from './lib/api.js'
 
+// Content inlined into index.html by the backend, when available. Section
+// pages inline only their own section ("partial"); the rest is fetched later.
+const bootstrap = window.__BIO_BOOTSTRAP__ || {}
+
 function App() {
-  const [portfolioData, setPortfolioData] = useState(null)
-  const [blogPosts, setBlogPosts] = useState([])
-  const [loading, setLoading] = useState(true)
+  const [portfolioData, setPortfolioData] = useState(bootstrap.content || null)
+  const [blogPosts, setBlogPosts] = useState(bootstrap.blog?.posts || [])
+  const [loading, setLoading] = useState(!bootstrap.blog)
 
   useEffect(() => {
-    fetchPortfolioData()
-    fetchBlogPosts()
+    if (!bootstrap.content || bootstrap.partial) fetchPortfolioData()
+    if (!bootstrap.blog) fetchBlogPosts()
   }, [])
 
   const fetchPortfolioData = async () => {
@@ -1,3 +1,4 @@
+import { Link } from 'react-router-dom'
 import './Blog.css'
 
 function Blog({ posts }) {
@@ -39,9 +40,15 @@ function Blog({ posts }) {
                   ))}
                 </div>
               )}
-              <a href={post.medium_url} target="_blank" rel="noopener noreferrer" className="read-more">
-                Read on Medium →
-              </a>
+              {post.medium_url ? (
+                <a href={post.medium_url} target="_blank" rel="noopener noreferrer" className="read-more">
+                  Read on Medium →
+                </a>
+              ) : (
+                <Link to={`/blog/${post.slug}`} className="read-more">
+                  Read more →
+                </Link>
+              )}
             </article>
           ))}
         </div>
@@ -17,12 +17,15 @@ function BlogPost() {
   const fetchBlogPost = async () => {
     try {
       const response = await axios.get(`${API_BASE_URL}/blog/slug/${slug}`)
-      setPost(response.data)
+      const data = response.data
+      setPost(data)
       setLoading(false)
-      // Redirect to Medium after a short delay
-      setTimeout(() => {
-        window.open(post.medium_url, '_blank', 'noopener,noreferrer')
-      }, 2000)
+      if (!data.content_html && data.medium_url) {
+        // Redirect to Medium after a short delay
+        setTimeout(() => {
+          window.open(data.medium_url, '_blank', 'noopener,noreferrer')
+        }, 2000)
+      }
     } catch (error) {
       console.error('Error fetching blog post:', error)
       setError('Blog post not found')
@@ -90,10 +93,17 @@ function BlogPost() {
           </div>
         )}
 
-        <div className="blog-post-redirect">
-          <p>Redirecting you to the full article on Medium...</p>
-          <p>If you are not redirected automatically, <a href={post.medium_url} target="_blank" rel="noopener noreferrer">click here</a>.</p>
-        </div>
+        {post.content_html ? (
+          <div
+            className="blog-post-content"
+            dangerouslySetInnerHTML={{ __html: post.content_html }}
+          />
+        ) : post.medium_url && (
+          <div className="blog-post-redirect">
+            <p>Redirecting you to the full article on Medium...</p>
+            <p>If you are not redirected automatically, <a href={post.medium_url} target="_blank" rel="noopener noreferrer">click here</a>.</p>
+          </div>
+        )}
       </div>
     </article>
   )